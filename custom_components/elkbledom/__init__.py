@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_MAC, EVENT_HOMEASSISTANT_STOP, Platform
@@ -9,13 +10,14 @@ from homeassistant.core import Event, HomeAssistant
 from .const import (
     CONF_BRIGHTNESS_MODE,
     CONF_DELAY,
+    CONF_MODEL,
     CONF_RESET,
     CONF_RGB_GAIN_B,
     CONF_RGB_GAIN_G,
     CONF_RGB_GAIN_R,
     DOMAIN,
 )
-from .coordinator import BLEDOMCoordinator
+from .coordinator import BLEDOMCoordinator, BLEDOMRSSICoordinator
 from .elkbledom import BLEDOMInstance
 
 LOGGER = logging.getLogger(__name__)
@@ -28,6 +30,16 @@ PLATFORMS: list[Platform] = [
     Platform.SENSOR,
 ]
 
+
+@dataclass(slots=True)
+class BLEDOMEntryData:
+    """Runtime data stored per config entry."""
+
+    instance: BLEDOMInstance
+    coordinator: BLEDOMCoordinator
+    rssi_coordinator: BLEDOMRSSICoordinator
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up ElkBLEDOM from a config entry."""
     reset = entry.options.get(CONF_RESET, None) or entry.data.get(CONF_RESET, None)
@@ -39,17 +51,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     brightness_mode = entry.options.get(CONF_BRIGHTNESS_MODE, "auto")
     LOGGER.debug("Config: Reset: %s, Delay: %s, Mac: %s", reset, delay, mac)
 
-    instance = BLEDOMInstance(mac, reset, delay, hass)
+    instance = BLEDOMInstance(mac, reset, delay, hass, entry.data.get(CONF_MODEL))
+    if instance.detected_model and instance.detected_model != entry.data.get(CONF_MODEL):
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_MODEL: instance.detected_model}
+        )
     instance.set_rgb_gains(rgb_gain_r, rgb_gain_g, rgb_gain_b)
     instance.brightness_mode = brightness_mode
 
     coordinator = BLEDOMCoordinator(hass, instance)
     await coordinator.async_config_entry_first_refresh()
+    rssi_coordinator = BLEDOMRSSICoordinator(hass, instance)
+    await rssi_coordinator.async_config_entry_first_refresh()
 
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
-        "instance": instance,
-        "coordinator": coordinator,
-    }
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = BLEDOMEntryData(
+        instance, coordinator, rssi_coordinator
+    )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
@@ -69,13 +86,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         data = hass.data[DOMAIN].pop(entry.entry_id)
-        await data["instance"].stop()
+        await data.instance.stop()
     return unload_ok
 
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
-    data = hass.data[DOMAIN][entry.entry_id]
-    instance = data["instance"]
+    instance = hass.data[DOMAIN][entry.entry_id].instance
     # Apply options live (avoid full reload for simple tuning).
     instance.set_rgb_gains(
         entry.options.get(CONF_RGB_GAIN_R, 1.0),
@@ -1,8 +1,13 @@
-from enum import Enum
+from enum import IntEnum
+from functools import reduce
+from operator import or_
+from types import MappingProxyType
 
 DOMAIN = "elkbledom"
 CONF_RESET = "reset"
 CONF_DELAY = "delay"
+# Model matched from the device name, remembered so restarts skip detection
+CONF_MODEL = "model"
 
 # Per-device RGB calibration gains applied to RGB writes.
 CONF_RGB_GAIN_R = "rgb_gain_r"
@@ -15,7 +20,7 @@ CONF_BRIGHTNESS_MODE = "brightness_mode"
 BRIGHTNESS_MODES = ["auto", "rgb", "native"]
 DEFAULT_BRIGHTNESS_MODE = "auto"
 
-class EFFECTS (Enum):
+class EFFECTS (IntEnum):
     # Light Effects (0x87-0x9C)
     jump_red_green_blue = 0x87
     jump_red_green_blue_yellow_cyan_magenta_white = 0x88
@@ -68,7 +73,7 @@ EFFECT_LABELS = {
     "blink_red_green_blue_yellow_cyan_magenta_white": "🎇 Blink All",
 }
 
-class MIC_EFFECTS (Enum):
+class MIC_EFFECTS (IntEnum):
     # Microphone Effects (0x80-0x87)
     mic_energic = 0x80
     mic_rhythm = 0x81
@@ -79,7 +84,7 @@ class MIC_EFFECTS (Enum):
     mic_effect_6 = 0x86
     mic_effect_7 = 0x87
 
-EFFECTS_list = [EFFECT_LABELS.get(e, e) for e in [
+EFFECTS_list = tuple(EFFECT_LABELS.get(e, e) for e in (
     'jump_red_green_blue',
     'jump_red_green_blue_yellow_cyan_magenta_white',
     'crossfade_red',
@@ -102,23 +107,17 @@ EFFECTS_list = [EFFECT_LABELS.get(e, e) for e in [
     'blink_magenta',
     'blink_white',
     'blink_red_green_blue_yellow_cyan_magenta_white'
-]]
+))
 
 # Reverse mapping: emoji label -> effect name
-EFFECT_LABEL_TO_NAME = {v: k for k, v in EFFECT_LABELS.items()}
+EFFECT_LABEL_TO_NAME = MappingProxyType({v: k for k, v in EFFECT_LABELS.items()})
 
-MIC_EFFECTS_list = [
-    'mic_energic',
-    'mic_rhythm',
-    'mic_spectrum',
-    'mic_rolling',
-    'mic_effect_4',
-    'mic_effect_5',
-    'mic_effect_6',
-    'mic_effect_7'
-    ]
+# Option name -> effect byte, in device order
+MIC_EFFECT_VALUES = {effect.name: effect.value for effect in MIC_EFFECTS}
+MIC_EFFECTS_list = tuple(MIC_EFFECT_VALUES)
+MIC_EFFECTS_set = frozenset(MIC_EFFECTS_list)
 
-class WEEK_DAYS (Enum):
+class WEEK_DAYS (IntEnum):
     monday = 0x01
     tuesday = 0x02
     wednesday = 0x04
@@ -126,9 +125,9 @@ class WEEK_DAYS (Enum):
     friday = 0x10
     saturday = 0x20
     sunday = 0x40
-    all = (0x01 + 0x02 + 0x04 + 0x08 + 0x10 + 0x20 + 0x40)
-    week_days = (0x01 + 0x02 + 0x04 + 0x08 + 0x10)
-    weekend_days = (0x20 + 0x40)
+    all = reduce(or_, (monday, tuesday, wednesday, thursday, friday, saturday, sunday))
+    week_days = reduce(or_, (monday, tuesday, wednesday, thursday, friday))
+    weekend_days = saturday | sunday
     none = 0x00
 
-#print(EFFECTS.blink_red.value)
+#print(EFFECTS.blink_red)
@@ -4,6 +4,7 @@ from __future__ import annotations
 import logging
 from datetime import timedelta
 
+from bleak.exc import BleakError
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
@@ -14,9 +15,11 @@ LOGGER = logging.getLogger(__name__)
 # Polling interval - BLE devices don't need frequent polling
 # State is also updated via notifications when available
 SCAN_INTERVAL = timedelta(seconds=60)
+# RSSI is diagnostic and comes from advertisements, not the connection
+RSSI_SCAN_INTERVAL = timedelta(seconds=60)
 
 
-class BLEDOMCoordinator(DataUpdateCoordinator[None]):
+class BLEDOMCoordinator(DataUpdateCoordinator[tuple]):
     """Coordinator to manage data updates for BLEDOM devices."""
 
     def __init__(self, hass: HomeAssistant, instance: BLEDOMInstance) -> None:
@@ -26,15 +29,53 @@ class BLEDOMCoordinator(DataUpdateCoordinator[None]):
             LOGGER,
             name=f"BLEDOM {instance.name}",
             update_interval=SCAN_INTERVAL,
+            # Only notify entities when the device state snapshot changes
+            always_update=False,
         )
         self.instance = instance
 
-    async def _async_update_data(self) -> None:
+    def _snapshot(self) -> tuple:
+        """Return a comparable snapshot of the device state."""
+        instance = self.instance
+        return (
+            instance.is_on,
+            instance.brightness,
+            tuple(instance.rgb_color or ()),
+            instance.color_temp_kelvin,
+            instance.effect,
+        )
+
+    async def _async_update_data(self) -> tuple:
         """Fetch data from the device."""
+        # The link just failed a write; don't add a BLE read on top of it
+        if self.instance.write_backoff_active and self.data is not None:
+            return self.data
         try:
             await self.instance.update()
-        except Exception as err:
-            LOGGER.debug("Error updating %s: %s", self.instance.name, err)
+        except (BleakError, TimeoutError) as err:
             # Don't raise UpdateFailed for transient BLE errors
             # The device will reconnect on the next command
-            pass
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug("Error updating %s: %s", self.instance.name, err)
+        return self._snapshot()
+
+
+class BLEDOMRSSICoordinator(DataUpdateCoordinator[int | None]):
+    """Coordinator for the RSSI sensor, polled apart from the light state."""
+
+    def __init__(self, hass: HomeAssistant, instance: BLEDOMInstance) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            LOGGER,
+            name=f"BLEDOM {instance.name} RSSI",
+            update_interval=RSSI_SCAN_INTERVAL,
+            always_update=False,
+        )
+        self.instance = instance
+
+    async def _async_update_data(self) -> int | None:
+        """Sample the RSSI of the last advertisement; no BLE connection needed."""
+        self.instance.update_rssi()
+        # The value the sensor shows, so always_update=False compares that
+        return self.instance.rssi_smoothed
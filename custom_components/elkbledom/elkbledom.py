@@ -1,10 +1,16 @@
 import asyncio
 import json
 import logging
+import os
+import re
+import struct
+import sys
 import traceback
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections import deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, TypeVar, cast
 
@@ -20,33 +26,83 @@ from bleak_retry_connector import (
 )
 from homeassistant.components.bluetooth import (
     async_ble_device_from_address,
-    async_discovered_service_info,
+    async_last_service_info,
 )
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.device_registry import CONNECTION_BLUETOOTH
+from homeassistant.helpers.entity import DeviceInfo
+
+from .const import DOMAIN
 
 LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModelConfig:
     """Configuration for a specific LED strip model."""
     name: str
     write_uuid: str
     read_uuid: str
-    turn_on_cmd: list[int]
-    turn_off_cmd: list[int]
-    white_cmd: list[int]
-    effect_speed_cmd: list[int]
-    effect_cmd: list[int]
-    color_temp_cmd: list[int]
+    turn_on_cmd: bytes
+    turn_off_cmd: bytes
+    white_cmd: bytes
+    effect_speed_cmd: bytes
+    effect_cmd: bytes
+    color_temp_cmd: bytes
     min_color_temp_k: int = 1800
     max_color_temp_k: int = 7000
     # Default RGB gains for better white balance (1.0 = no adjustment)
     default_rgb_gains: tuple[float, float, float] = (1.0, 1.0, 1.0)
     # Alternative commands for hardware variants (e.g., ELK-BLEDDM has 0x00 vs 0x04)
-    alt_turn_on_cmd: list[int] | None = None
-    alt_turn_off_cmd: list[int] | None = None
-
+    alt_turn_on_cmd: bytes | None = None
+    alt_turn_off_cmd: bytes | None = None
+    # Write-ready byte templates and the positions of their 0xbb placeholders,
+    # derived once from the commands above
+    turn_on_bytes: bytes = field(init=False, repr=False)
+    turn_off_bytes: bytes = field(init=False, repr=False)
+    alt_turn_on_bytes: bytes | None = field(init=False, repr=False)
+    alt_turn_off_bytes: bytes | None = field(init=False, repr=False)
+    white_template: bytes = field(init=False, repr=False)
+    white_bb_idx: int = field(init=False, repr=False)
+    effect_speed_template: bytes = field(init=False, repr=False)
+    effect_speed_bb_idx: int = field(init=False, repr=False)
+    effect_template: bytes = field(init=False, repr=False)
+    effect_bb_idx: int = field(init=False, repr=False)
+    color_temp_template: bytes = field(init=False, repr=False)
+    color_temp_bb_idx: tuple[int, ...] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Frozen dataclass: derived fields go through object.__setattr__
+        setattr_ = object.__setattr__
+        setattr_(self, "turn_on_bytes", bytes(self.turn_on_cmd))
+        setattr_(self, "turn_off_bytes", bytes(self.turn_off_cmd))
+        setattr_(self, "alt_turn_on_bytes", None if self.alt_turn_on_cmd is None else bytes(self.alt_turn_on_cmd))
+        setattr_(self, "alt_turn_off_bytes", None if self.alt_turn_off_cmd is None else bytes(self.alt_turn_off_cmd))
+        setattr_(self, "white_template", bytes(self.white_cmd))
+        setattr_(self, "white_bb_idx", self.white_template.find(0xbb))
+        setattr_(self, "effect_speed_template", bytes(self.effect_speed_cmd))
+        setattr_(self, "effect_speed_bb_idx", self.effect_speed_template.find(0xbb))
+        setattr_(self, "effect_template", bytes(self.effect_cmd))
+        setattr_(self, "effect_bb_idx", self.effect_template.find(0xbb))
+        setattr_(self, "color_temp_template", bytes(self.color_temp_cmd))
+        # Warm and cold positions, or () when the template has fewer than two
+        color_temp_bb_idx = tuple(i for i, v in enumerate(self.color_temp_cmd) if v == 0xbb)[:2]
+        setattr_(self, "color_temp_bb_idx", color_temp_bb_idx if len(color_temp_bb_idx) == 2 else ())
+
+
+# Command templates shared by several models. 0xbb marks the bytes that
+# get patched with a value before sending. The power commands are named after
+# their state byte.
+_CMD_POWER_F0 = bytes((0x7e, 0x00, 0x04, 0xf0, 0x00, 0x01, 0xff, 0x00, 0xef))
+_CMD_POWER_01 = bytes((0x7e, 0x00, 0x04, 0x01, 0x00, 0x00, 0x00, 0x00, 0xef))
+_CMD_POWER_00 = bytes((0x7e, 0x00, 0x04, 0x00, 0x00, 0x00, 0xff, 0x00, 0xef))
+_CMD_WHITE_STD = bytes((0x7e, 0x00, 0x01, 0xbb, 0x00, 0x00, 0x00, 0x00, 0xef))
+_CMD_EFFECT_SPEED_STD = bytes((0x7e, 0x00, 0x02, 0xbb, 0x00, 0x00, 0x00, 0x00, 0xef))
+_CMD_EFFECT_SPEED_MELK = bytes((0x7e, 0x04, 0x02, 0xbb, 0xff, 0xff, 0xff, 0x00, 0xef))
+_CMD_EFFECT_STD = bytes((0x7e, 0x00, 0x03, 0xbb, 0x03, 0x00, 0x00, 0x00, 0xef))
+_CMD_EFFECT_MELK = bytes((0x7e, 0x05, 0x03, 0xbb, 0x06, 0xff, 0xff, 0x00, 0xef))
+_CMD_COLOR_TEMP_STD = bytes((0x7e, 0x00, 0x05, 0x02, 0xbb, 0xbb, 0x00, 0x00, 0xef))
+_CMD_COLOR_TEMP_MELK = bytes((0x7e, 0x06, 0x05, 0x02, 0xbb, 0xbb, 0xff, 0x08, 0xef))
 
 # Model database - each model has its own configuration
 MODEL_DB: dict[str, ModelConfig] = {
@@ -54,189 +110,301 @@ MODEL_DB: dict[str, ModelConfig] = {
         name="ELK-BLEDDM",
         write_uuid="0000fff3-0000-1000-8000-00805f9b34fb",
         read_uuid="0000fff4-0000-1000-8000-00805f9b34fb",
-        turn_on_cmd=[0x7e, 0x04, 0x04, 0xf0, 0x00, 0x01, 0xff, 0x00, 0xef],
-        turn_off_cmd=[0x7e, 0x04, 0x04, 0x00, 0x00, 0x00, 0xff, 0x00, 0xef],
-        white_cmd=[0x7e, 0x00, 0x01, 0xbb, 0x00, 0x00, 0x00, 0x00, 0xef],
-        effect_speed_cmd=[0x7e, 0x00, 0x02, 0xbb, 0x00, 0x00, 0x00, 0x00, 0xef],
-        effect_cmd=[0x7e, 0x00, 0x03, 0xbb, 0x03, 0x00, 0x00, 0x00, 0xef],
-        color_temp_cmd=[0x7e, 0x00, 0x05, 0x02, 0xbb, 0xbb, 0x00, 0x00, 0xef],
+        turn_on_cmd=bytes((0x7e, 0x04, 0x04, 0xf0, 0x00, 0x01, 0xff, 0x00, 0xef)),
+        turn_off_cmd=bytes((0x7e, 0x04, 0x04, 0x00, 0x00, 0x00, 0xff, 0x00, 0xef)),
+        white_cmd=_CMD_WHITE_STD,
+        effect_speed_cmd=_CMD_EFFECT_SPEED_STD,
+        effect_cmd=_CMD_EFFECT_STD,
+        color_temp_cmd=_CMD_COLOR_TEMP_STD,
         default_rgb_gains=(1.00, 0.88, 0.38),
         # Some ELK-BLEDDM units use 0x00 instead of 0x04 as the second byte
-        alt_turn_on_cmd=[0x7e, 0x00, 0x04, 0xf0, 0x00, 0x01, 0xff, 0x00, 0xef],
-        alt_turn_off_cmd=[0x7e, 0x00, 0x04, 0x00, 0x00, 0x00, 0xff, 0x00, 0xef],
+        alt_turn_on_cmd=_CMD_POWER_F0,
+        alt_turn_off_cmd=_CMD_POWER_00,
     ),
     "ELK-BLE": ModelConfig(
         name="ELK-BLE",
         write_uuid="0000fff3-0000-1000-8000-00805f9b34fb",
         read_uuid="0000fff4-0000-1000-8000-00805f9b34fb",
-        turn_on_cmd=[0x7e, 0x00, 0x04, 0xf0, 0x00, 0x01, 0xff, 0x00, 0xef],
-        turn_off_cmd=[0x7e, 0x00, 0x04, 0x00, 0x00, 0x00, 0xff, 0x00, 0xef],
-        white_cmd=[0x7e, 0x00, 0x01, 0xbb, 0x00, 0x00, 0x00, 0x00, 0xef],
-        effect_speed_cmd=[0x7e, 0x00, 0x02, 0xbb, 0x00, 0x00, 0x00, 0x00, 0xef],
-        effect_cmd=[0x7e, 0x00, 0x03, 0xbb, 0x03, 0x00, 0x00, 0x00, 0xef],
-        color_temp_cmd=[0x7e, 0x00, 0x05, 0x02, 0xbb, 0xbb, 0x00, 0x00, 0xef],
+        turn_on_cmd=_CMD_POWER_F0,
+        turn_off_cmd=_CMD_POWER_00,
+        white_cmd=_CMD_WHITE_STD,
+        effect_speed_cmd=_CMD_EFFECT_SPEED_STD,
+        effect_cmd=_CMD_EFFECT_STD,
+        color_temp_cmd=_CMD_COLOR_TEMP_STD,
     ),
     "LEDBLE": ModelConfig(
         name="LEDBLE",
         write_uuid="0000ffe1-0000-1000-8000-00805f9b34fb",
         read_uuid="0000ffe2-0000-1000-8000-00805f9b34fb",
-        turn_on_cmd=[0x7e, 0x00, 0x04, 0x01, 0x00, 0x00, 0x00, 0x00, 0xef],
-        turn_off_cmd=[0x7e, 0x00, 0x04, 0x00, 0x00, 0x00, 0xff, 0x00, 0xef],
-        white_cmd=[0x7e, 0x00, 0x01, 0xbb, 0x00, 0x00, 0x00, 0x00, 0xef],
-        effect_speed_cmd=[0x7e, 0x00, 0x02, 0xbb, 0x00, 0x00, 0x00, 0x00, 0xef],
-        effect_cmd=[0x7e, 0x00, 0x03, 0xbb, 0x03, 0x00, 0x00, 0x00, 0xef],
-        color_temp_cmd=[0x7e, 0x00, 0x05, 0x02, 0xbb, 0xbb, 0x00, 0x00, 0xef],
+        turn_on_cmd=_CMD_POWER_01,
+        turn_off_cmd=_CMD_POWER_00,
+        white_cmd=_CMD_WHITE_STD,
+        effect_speed_cmd=_CMD_EFFECT_SPEED_STD,
+        effect_cmd=_CMD_EFFECT_STD,
+        color_temp_cmd=_CMD_COLOR_TEMP_STD,
     ),
     "MELK-OG10": ModelConfig(
         name="MELK-OG10",
         write_uuid="0000fff3-0000-1000-8000-00805f9b34fb",
         read_uuid="0000fff4-0000-1000-8000-00805f9b34fb",
-        turn_on_cmd=[0x7e, 0x07, 0x04, 0xff, 0x00, 0x01, 0x02, 0x01, 0xef],
-        turn_off_cmd=[0x7e, 0x07, 0x04, 0x00, 0x00, 0x00, 0x02, 0x00, 0xef],
-        white_cmd=[0x7e, 0x07, 0x05, 0x01, 0xbb, 0xff, 0x02, 0x01],
-        effect_speed_cmd=[0x7e, 0x04, 0x02, 0xbb, 0xff, 0xff, 0xff, 0x00, 0xef],
-        effect_cmd=[0x7e, 0x05, 0x03, 0xbb, 0x06, 0xff, 0xff, 0x00, 0xef],
-        color_temp_cmd=[0x7e, 0x06, 0x05, 0x02, 0xbb, 0xbb, 0xff, 0x08, 0xef],
+        turn_on_cmd=bytes((0x7e, 0x07, 0x04, 0xff, 0x00, 0x01, 0x02, 0x01, 0xef)),
+        turn_off_cmd=bytes((0x7e, 0x07, 0x04, 0x00, 0x00, 0x00, 0x02, 0x00, 0xef)),
+        white_cmd=bytes((0x7e, 0x07, 0x05, 0x01, 0xbb, 0xff, 0x02, 0x01)),
+        effect_speed_cmd=_CMD_EFFECT_SPEED_MELK,
+        effect_cmd=_CMD_EFFECT_MELK,
+        color_temp_cmd=_CMD_COLOR_TEMP_MELK,
     ),
     "MELK": ModelConfig(
         name="MELK",
         write_uuid="0000fff3-0000-1000-8000-00805f9b34fb",
         read_uuid="0000fff4-0000-1000-8000-00805f9b34fb",
-        turn_on_cmd=[0x7e, 0x00, 0x04, 0x01, 0x00, 0x00, 0x00, 0x00, 0xef],
-        turn_off_cmd=[0x7e, 0x00, 0x04, 0x00, 0x00, 0x00, 0xff, 0x00, 0xef],
-        white_cmd=[0x7e, 0x00, 0x01, 0xbb, 0x00, 0x00, 0x00, 0x00, 0xef],
-        effect_speed_cmd=[0x7e, 0x04, 0x02, 0xbb, 0xff, 0xff, 0xff, 0x00, 0xef],
-        effect_cmd=[0x7e, 0x05, 0x03, 0xbb, 0x06, 0xff, 0xff, 0x00, 0xef],
-        color_temp_cmd=[0x7e, 0x06, 0x05, 0x02, 0xbb, 0xbb, 0xff, 0x08, 0xef],
+        turn_on_cmd=_CMD_POWER_01,
+        turn_off_cmd=_CMD_POWER_00,
+        white_cmd=_CMD_WHITE_STD,
+        effect_speed_cmd=_CMD_EFFECT_SPEED_MELK,
+        effect_cmd=_CMD_EFFECT_MELK,
+        color_temp_cmd=_CMD_COLOR_TEMP_MELK,
     ),
     "ELK-BULB2": ModelConfig(
         name="ELK-BULB2",
         write_uuid="0000fff3-0000-1000-8000-00805f9b34fb",
         read_uuid="0000fff4-0000-1000-8000-00805f9b34fb",
-        turn_on_cmd=[0x7e, 0x00, 0x04, 0xf0, 0x00, 0x01, 0xff, 0x00, 0xef],
-        turn_off_cmd=[0x7e, 0x00, 0x04, 0x01, 0x00, 0x00, 0x00, 0x00, 0xef],
-        white_cmd=[0x7e, 0x00, 0x01, 0xbb, 0x00, 0x00, 0x00, 0x00, 0xef],
-        effect_speed_cmd=[0x7e, 0x00, 0x02, 0xbb, 0x00, 0x00, 0x00, 0x00, 0xef],
-        effect_cmd=[0x7e, 0x00, 0x03, 0xbb, 0x03, 0x00, 0x00, 0x00, 0xef],
-        color_temp_cmd=[0x7e, 0x00, 0x05, 0x02, 0xbb, 0xbb, 0x00, 0x00, 0xef],
+        turn_on_cmd=_CMD_POWER_F0,
+        turn_off_cmd=_CMD_POWER_01,
+        white_cmd=_CMD_WHITE_STD,
+        effect_speed_cmd=_CMD_EFFECT_SPEED_STD,
+        effect_cmd=_CMD_EFFECT_STD,
+        color_temp_cmd=_CMD_COLOR_TEMP_STD,
     ),
     "ELK-BULB": ModelConfig(
         name="ELK-BULB",
         write_uuid="0000fff3-0000-1000-8000-00805f9b34fb",
         read_uuid="0000fff4-0000-1000-8000-00805f9b34fb",
-        turn_on_cmd=[0x7e, 0x00, 0x04, 0x01, 0x00, 0x00, 0x00, 0x00, 0xef],
-        turn_off_cmd=[0x7e, 0x00, 0x04, 0x00, 0x00, 0x00, 0xff, 0x00, 0xef],
-        white_cmd=[0x7e, 0x00, 0x01, 0xbb, 0x00, 0x00, 0x00, 0x00, 0xef],
-        effect_speed_cmd=[0x7e, 0x00, 0x02, 0xbb, 0x00, 0x00, 0x00, 0x00, 0xef],
-        effect_cmd=[0x7e, 0x00, 0x03, 0xbb, 0x03, 0x00, 0x00, 0x00, 0xef],
-        color_temp_cmd=[0x7e, 0x00, 0x05, 0x02, 0xbb, 0xbb, 0x00, 0x00, 0xef],
+        turn_on_cmd=_CMD_POWER_01,
+        turn_off_cmd=_CMD_POWER_00,
+        white_cmd=_CMD_WHITE_STD,
+        effect_speed_cmd=_CMD_EFFECT_SPEED_STD,
+        effect_cmd=_CMD_EFFECT_STD,
+        color_temp_cmd=_CMD_COLOR_TEMP_STD,
     ),
     "ELK-LAMPL": ModelConfig(
         name="ELK-LAMPL",
         write_uuid="0000fff3-0000-1000-8000-00805f9b34fb",
         read_uuid="0000fff4-0000-1000-8000-00805f9b34fb",
-        turn_on_cmd=[0x7e, 0x00, 0x04, 0x01, 0x00, 0x00, 0x00, 0x00, 0xef],
-        turn_off_cmd=[0x7e, 0x00, 0x04, 0x00, 0x00, 0x00, 0xff, 0x00, 0xef],
-        white_cmd=[0x7e, 0x00, 0x01, 0xbb, 0x00, 0x00, 0x00, 0x00, 0xef],
-        effect_speed_cmd=[0x7e, 0x00, 0x02, 0xbb, 0x00, 0x00, 0x00, 0x00, 0xef],
-        effect_cmd=[0x7e, 0x00, 0x03, 0xbb, 0x03, 0x00, 0x00, 0x00, 0xef],
-        color_temp_cmd=[0x7e, 0x00, 0x05, 0x02, 0xbb, 0xbb, 0x00, 0x00, 0xef],
+        turn_on_cmd=_CMD_POWER_01,
+        turn_off_cmd=_CMD_POWER_00,
+        white_cmd=_CMD_WHITE_STD,
+        effect_speed_cmd=_CMD_EFFECT_SPEED_STD,
+        effect_cmd=_CMD_EFFECT_STD,
+        color_temp_cmd=_CMD_COLOR_TEMP_STD,
     ),
 }
 
+# Matches a device name against every model prefix in one pass. Alternatives
+# are tried in MODEL_DB order, so longer prefixes such as "ELK-BLEDDM" listed
+# before "ELK-BLE" keep winning, exactly like the old startswith() loop.
+_PREFIX_RE = re.compile("|".join(re.escape(name) for name in MODEL_DB), re.IGNORECASE)
+_PREFIX_LOWER_TO_NAME = {name.lower(): name for name in MODEL_DB}
+# For a plain supported/unsupported check, str.startswith() with a tuple
+_PREFIXES_LOWER = tuple(_PREFIX_LOWER_TO_NAME)
+
+# MODEL_DB never changes at runtime, so these are computed once
+_SUPPORTED_PREFIXES = tuple(MODEL_DB)
+_READ_UUIDS = frozenset(m.read_uuid for m in MODEL_DB.values())
+_WRITE_UUIDS = frozenset(m.write_uuid for m in MODEL_DB.values())
 
-def get_supported_name_prefixes() -> list[str]:
-    """Get list of supported device name prefixes."""
-    return list(MODEL_DB.keys())
 
+def get_supported_name_prefixes() -> tuple[str, ...]:
+    """Get supported device name prefixes."""
+    return _SUPPORTED_PREFIXES
 
-def get_all_characteristic_uuids() -> tuple[set[str], set[str]]:
+
+def get_all_characteristic_uuids() -> tuple[frozenset[str], frozenset[str]]:
     """Get unique read and write characteristic UUIDs from all models.
 
     Returns:
-        Tuple of (read_uuids, write_uuids) as sets.
+        Tuple of (read_uuids, write_uuids) as frozensets.
     """
-    read_uuids = {m.read_uuid for m in MODEL_DB.values()}
-    write_uuids = {m.write_uuid for m in MODEL_DB.values()}
-    return read_uuids, write_uuids
+    return _READ_UUIDS, _WRITE_UUIDS
 
 # Query/Status commands to try for different LED strip models
-# Format: [command_bytes, description]
-QUERY_COMMANDS = [
-    # Standard ELK-BLEDOM commands
-    ([0x7e, 0x00, 0x01, 0xfa, 0x00, 0x00, 0x00, 0x00, 0xef], "Standard status query"),
-    ([0x7e, 0x00, 0x10, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef], "Alternative query v1"),
-    ([0x7e, 0x00, 0x81, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef], "Status query 0x81"),
-    ([0x7e, 0x00, 0x82, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef], "Status query 0x82"),
-    ([0x7e, 0x00, 0x83, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef], "Status query 0x83"),
+# Format: (command_bytes, description)
+
+# Standard ELK-BLEDOM commands
+_QUERY_ELK: tuple[tuple[bytes, str], ...] = (
+    (bytes((0x7e, 0x00, 0x01, 0xfa, 0x00, 0x00, 0x00, 0x00, 0xef)), "Standard status query"),
+    (bytes((0x7e, 0x00, 0x10, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef)), "Alternative query v1"),
+    (bytes((0x7e, 0x00, 0x81, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef)), "Status query 0x81"),
+    (bytes((0x7e, 0x00, 0x82, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef)), "Status query 0x82"),
+    (bytes((0x7e, 0x00, 0x83, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef)), "Status query 0x83"),
+)
 
-    # Short format commands
-    ([0xef, 0x01, 0x77], "Short query v1"),
-    ([0x7e, 0x00, 0x10], "Short query v2"),
-    ([0x7e, 0x10], "Minimal query"),
-    ([0x25, 0x00], "Minimal query 2"),
-    ([0x25, 0x02], "Minimal query 3"),
+# MELK specific commands
+_QUERY_MELK: tuple[tuple[bytes, str], ...] = (
+    (bytes((0x7e, 0x04, 0x01, 0x00, 0xff, 0x00, 0xff, 0x00, 0xef)), "MELK status query"),
+    (bytes((0x7e, 0x07, 0x01, 0x00, 0x00, 0x00, 0x02, 0x00, 0xef)), "MELK query v2"),
+)
 
-    # MELK specific commands
-    ([0x7e, 0x04, 0x01, 0x00, 0xff, 0x00, 0xff, 0x00, 0xef], "MELK status query"),
-    ([0x7e, 0x07, 0x01, 0x00, 0x00, 0x00, 0x02, 0x00, 0xef], "MELK query v2"),
+# LEDBLE specific
+_QUERY_LEDBLE: tuple[tuple[bytes, str], ...] = (
+    (bytes((0x7e, 0x00, 0x04, 0xfa, 0x00, 0x00, 0x00, 0x00, 0xef)), "LEDBLE status"),
+    (bytes((0xcc, 0x23, 0x33)), "LEDBLE short status"),
+)
 
-    # Alternative long format
-    ([0x7e, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef], "Get all status"),
-    ([0x7e, 0x01, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef], "Status cmd 0x01"),
-    ([0x7e, 0x04, 0x00, 0x00, 0x00, 0x00, 0xff, 0x00, 0xef], "Power status query"),
+# Probes not tied to a model family
+_QUERY_GENERIC: tuple[tuple[bytes, str], ...] = (
+    # Short format commands
+    (bytes((0xef, 0x01, 0x77)), "Short query v1"),
+    (bytes((0x7e, 0x00, 0x10)), "Short query v2"),
+    (bytes((0x7e, 0x10)), "Minimal query"),
+    (bytes((0x25, 0x00)), "Minimal query 2"),
+    (bytes((0x25, 0x02)), "Minimal query 3"),
 
-    # LEDBLE specific
-    ([0x7e, 0x00, 0x04, 0xfa, 0x00, 0x00, 0x00, 0x00, 0xef], "LEDBLE status"),
-    ([0xcc, 0x23, 0x33], "LEDBLE short status"),
+    # Alternative long format
+    (bytes((0x7e, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef)), "Get all status"),
+    (bytes((0x7e, 0x01, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef)), "Status cmd 0x01"),
+    (bytes((0x7e, 0x04, 0x00, 0x00, 0x00, 0x00, 0xff, 0x00, 0xef)), "Power status query"),
 
     # Other variants found in wild
-    ([0xaa, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x55], "Variant header 0xaa"),
-    ([0x7e, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef], "Query cmd 0x05"),
+    (bytes((0xaa, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x55)), "Variant header 0xaa"),
+    (bytes((0x7e, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef)), "Query cmd 0x05"),
 
     # ========== 30 COMANDOS ADICIONALES ==========
 
     # Variantes 0x7e con diferentes bytes de comando (0x02-0x0f)
-    ([0x7e, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef], "Query cmd 0x02"),
-    ([0x7e, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef], "Query cmd 0x03"),
-    ([0x7e, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef], "Query cmd 0x06"),
-    ([0x7e, 0x00, 0x07, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef], "Query cmd 0x07"),
-    ([0x7e, 0x00, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef], "Query cmd 0x08"),
-    ([0x7e, 0x00, 0x09, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef], "Query cmd 0x09"),
-    ([0x7e, 0x00, 0x0a, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef], "Query cmd 0x0a"),
-    ([0x7e, 0x00, 0x0b, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef], "Query cmd 0x0b"),
-    ([0x7e, 0x00, 0x0c, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef], "Query cmd 0x0c"),
-    ([0x7e, 0x00, 0x0d, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef], "Query cmd 0x0d"),
+    (bytes((0x7e, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef)), "Query cmd 0x02"),
+    (bytes((0x7e, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef)), "Query cmd 0x03"),
+    (bytes((0x7e, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef)), "Query cmd 0x06"),
+    (bytes((0x7e, 0x00, 0x07, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef)), "Query cmd 0x07"),
+    (bytes((0x7e, 0x00, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef)), "Query cmd 0x08"),
+    (bytes((0x7e, 0x00, 0x09, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef)), "Query cmd 0x09"),
+    (bytes((0x7e, 0x00, 0x0a, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef)), "Query cmd 0x0a"),
+    (bytes((0x7e, 0x00, 0x0b, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef)), "Query cmd 0x0b"),
+    (bytes((0x7e, 0x00, 0x0c, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef)), "Query cmd 0x0c"),
+    (bytes((0x7e, 0x00, 0x0d, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef)), "Query cmd 0x0d"),
 
     # Comandos con segundo byte variable (prefijo alternativo)
-    ([0x7e, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef], "Query prefix 0x01"),
-    ([0x7e, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef], "Query prefix 0x02"),
-    ([0x7e, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef], "Query prefix 0x03"),
-    ([0x7e, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef], "Query prefix 0x05"),
-    ([0x7e, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef], "Query prefix 0x06"),
-    ([0x7e, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef], "Query prefix 0x08"),
-    ([0x7e, 0x09, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef], "Query prefix 0x09"),
+    (bytes((0x7e, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef)), "Query prefix 0x01"),
+    (bytes((0x7e, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef)), "Query prefix 0x02"),
+    (bytes((0x7e, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef)), "Query prefix 0x03"),
+    (bytes((0x7e, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef)), "Query prefix 0x05"),
+    (bytes((0x7e, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef)), "Query prefix 0x06"),
+    (bytes((0x7e, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef)), "Query prefix 0x08"),
+    (bytes((0x7e, 0x09, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef)), "Query prefix 0x09"),
 
     # Comandos cortos con diferentes protocolos
-    ([0xef, 0x01], "Minimal EF query"),
-    ([0xef, 0x77], "EF query 0x77"),
-    ([0xef, 0x00], "EF query 0x00"),
-    ([0x10, 0x00], "Query 0x10 0x00"),
-    ([0x10, 0x01], "Query 0x10 0x01"),
-    ([0xaa, 0x00], "AA protocol query"),
-    ([0xbb, 0x00, 0x00], "BB protocol query"),
+    (bytes((0xef, 0x01)), "Minimal EF query"),
+    (bytes((0xef, 0x77)), "EF query 0x77"),
+    (bytes((0xef, 0x00)), "EF query 0x00"),
+    (bytes((0x10, 0x00)), "Query 0x10 0x00"),
+    (bytes((0x10, 0x01)), "Query 0x10 0x01"),
+    (bytes((0xaa, 0x00)), "AA protocol query"),
+    (bytes((0xbb, 0x00, 0x00)), "BB protocol query"),
 
     # Comandos tipo checksum/CRC diferentes
-    ([0x7e, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0xff], "Query end 0xff"),
-    ([0x7e, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0xfe], "Query end 0xfe"),
-    ([0x7e, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0xee], "Query end 0xee"),
+    (bytes((0x7e, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0xff)), "Query end 0xff"),
+    (bytes((0x7e, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0xfe)), "Query end 0xfe"),
+    (bytes((0x7e, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0xee)), "Query end 0xee"),
 
     # Comandos tipo "ping" o "hello"
-    ([0xff, 0x00, 0x00], "Ping command"),
-    ([0x00, 0x00, 0x00], "Null query"),
-    ([0x01], "Single byte query"),
-    ([0xff], "Single 0xFF query"),
-]
+    (bytes((0xff, 0x00, 0x00)), "Ping command"),
+    (bytes((0x00, 0x00, 0x00)), "Null query"),
+    (bytes((0x01,)), "Single byte query"),
+    (bytes((0xff,)), "Single 0xFF query"),
+)
+
+# Probes for each model; the generic "*" probes are tried after the
+# model's own ones
+QUERY_COMMANDS_BY_MODEL: dict[str, tuple[tuple[bytes, str], ...]] = {
+    "ELK-BLEDDM": _QUERY_ELK,
+    "ELK-BLE": _QUERY_ELK,
+    "LEDBLE": _QUERY_LEDBLE,
+    "MELK-OG10": _QUERY_MELK,
+    "MELK": _QUERY_MELK,
+    "ELK-BULB2": _QUERY_ELK,
+    "ELK-BULB": _QUERY_ELK,
+    "ELK-LAMPL": _QUERY_ELK,
+    "*": _QUERY_GENERIC,
+}
+
+# Status notification: 7e ?? cmd power r g b brightness% ef
+_STATUS_FRAME = struct.Struct(">BxBBBBBBB")
+# Reported brightness percent (0-100) to Home Assistant brightness (0-255)
+_PCT_TO_255 = bytes(round(pct * 255 / 100) for pct in range(101))
+# Home Assistant brightness (0-255) to device brightness percent (0-100),
+# rounded the same way so a percent survives the round trip unchanged
+_255_TO_PCT = bytes(round(value * 100 / 255) for value in range(256))
+
+# Constant frames
+_CMD_MIC_ENABLE = bytes((0x7e, 0x04, 0x07, 0x01, 0xff, 0xff, 0xff, 0x00, 0xef))
+_CMD_MIC_DISABLE = bytes((0x7e, 0x04, 0x07, 0x00, 0xff, 0xff, 0xff, 0x00, 0xef))
+# MODELX login handshake
+_CMD_LOGIN_1 = bytes((0x7e, 0x07, 0x83))
+_CMD_LOGIN_2 = bytes((0x7e, 0x04, 0x04))
+
+# Time sync frame: 7e 00 83 HH MM SS weekday 00 ef. Only the four time
+# bytes change, so they are patched in place and a bytes copy is queued;
+# the template is shared by all devices.
+_SYNC_TIME_TEMPLATE = bytearray((0x7e, 0x00, 0x83, 0x00, 0x00, 0x00, 0x00, 0x00, 0xef))
+_SYNC_TIME_FIELDS = memoryview(_SYNC_TIME_TEMPLATE)[3:7]
+
+# RGB emulation of colour temperature interpolates between warm white and
+# cool white. Values based on common RGB LED color temperature emulation.
+_CCT_WARM_RGB = (255, 138, 18)   # ~1800K - very warm/orange
+_CCT_COOL_RGB = (180, 220, 255)  # ~7000K - cool/blue-white
+# Interpolated RGB for every percent from warm (0) to cool (100)
+_CCT_LUT = tuple(
+    tuple(warm + (cool - warm) * pct // 100 for warm, cool in zip(_CCT_WARM_RGB, _CCT_COOL_RGB, strict=True))
+    for pct in range(101)
+)
+
+
+@lru_cache(maxsize=256)
+def _cct_rgb(pct: int, brightness: int) -> tuple[int, int, int]:
+    """Return the emulated RGB for a colour temperature percent and brightness."""
+    r, g, b = _CCT_LUT[pct]
+    return r * brightness // 255, g * brightness // 255, b * brightness // 255
+
+
+_IDENTITY_LUT = tuple(range(256))
+
+
+def _gain_lut(gain: float) -> tuple[int, ...]:
+    """Return the gained and clamped output for every 0-255 channel value."""
+    if gain == 1.0:
+        return _IDENTITY_LUT
+    return tuple(min(255, round(value * gain)) for value in range(256))
+
+
+def _clamp(value: int, low: int, high: int) -> int:
+    """Clamp a command byte value to the range the device accepts."""
+    return low if value < low else high if value > high else value
+
+
+# Queued writes are flushed after this short delay so that bursts of
+# commands (slider drags, effect changes) go out in one connection.
+WRITE_FLUSH_DELAY = 0.005
+# After a failed write, hold further submissions back for this long so the
+# connection can recover instead of being hammered with retries.
+WRITE_BACKOFF_TIME = 0.25
+# Guards reads and writes of the query command cache file shared by all
+# devices, and the parsed snapshot below
+_QUERY_CACHE_LOCK = asyncio.Lock()
+
+
+@dataclass(slots=True)
+class _QueryCacheSnapshot:
+    """Parsed query cache file, shared by all devices."""
+
+    data: dict = field(default_factory=dict)
+    mtime: float | None = None  # File mtime when data was read
+
+
+_QUERY_CACHE_SNAPSHOT = _QueryCacheSnapshot()
+
+# RSSI varies by several dB between advertisements; the sensor reports the
+# mean of this many recent samples
+RSSI_WINDOW = 8
 
 DEFAULT_ATTEMPTS = 3
 BLEAK_BACKOFF_TIME = 0.25
@@ -254,39 +422,36 @@ def retry_bluetooth_connection_error(func: WrapFuncType) -> WrapFuncType:
     async def _async_wrap_retry_bluetooth_connection_error(
         self: "BLEDOMInstance", *args: Any, **kwargs: Any
     ) -> Any:
-        attempts = DEFAULT_ATTEMPTS
-        max_attempts = attempts - 1
-
-        for attempt in range(attempts):
+        max_attempts = DEFAULT_ATTEMPTS - 1
+        for attempt in range(DEFAULT_ATTEMPTS):
             try:
                 return await func(self, *args, **kwargs)
             except BleakNotFoundError:
-                # The lock cannot be found so there is no
+                # The device cannot be found so there is no
                 # point in retrying.
                 raise
-            except RETRY_BACKOFF_EXCEPTIONS as err:
-                if attempt >= max_attempts:
-                    LOGGER.debug("%s: %s error calling %s, reach max attempts (%s/%s)",self.name,type(err),func,attempt,max_attempts,exc_info=True,)
-                    raise
-                LOGGER.debug("%s: %s error calling %s, backing off %ss, retrying (%s/%s)...",self.name,type(err),func,BLEAK_BACKOFF_TIME,attempt,max_attempts,exc_info=True,)
-                await asyncio.sleep(BLEAK_BACKOFF_TIME)
             except BLEAK_EXCEPTIONS as err:
                 if attempt >= max_attempts:
-                    LOGGER.debug("%s: %s error calling %s, reach max attempts (%s/%s): %s",self.name,type(err),func,attempt,max_attempts,err,exc_info=True,)
+                    LOGGER.debug("%s: %s error calling %s, reach max attempts (%s/%s)", self.name, type(err), func, attempt, max_attempts, exc_info=True)
                     raise
-                LOGGER.debug("%s: %s error calling %s, retrying  (%s/%s)...: %s",self.name,type(err),func,attempt,max_attempts,err,exc_info=True,)
+                LOGGER.debug("%s: %s error calling %s, retrying (%s/%s)...", self.name, type(err), func, attempt, max_attempts, exc_info=True)
+                if isinstance(err, RETRY_BACKOFF_EXCEPTIONS):
+                    await asyncio.sleep(BLEAK_BACKOFF_TIME)
 
     return cast(WrapFuncType, _async_wrap_retry_bluetooth_connection_error)
 
 class CharacteristicMissingError(Exception):
     """Raised when a characteristic is missing."""
 class DeviceData:
+    __slots__ = ("_discovery", "_supported", "_address", "_name", "_rssi", "_adv_time", "_hass", "_bledevice")
+
     def __init__(self, hass, discovery_info):
         self._discovery = discovery_info
-        self._supported = any(self._discovery.name.lower().startswith(prefix.lower()) for prefix in MODEL_DB.keys())
+        self._supported = (self._discovery.name or '').lower().startswith(_PREFIXES_LOWER)
         self._address = self._discovery.address
         self._name = self._discovery.name
         self._rssi = self._discovery.rssi
+        self._adv_time = self._discovery.time
         self._hass = hass
         self._bledevice = async_ble_device_from_address(hass, self._address)
 
@@ -313,17 +478,40 @@ class DeviceData:
     def bledevice(self) -> BLEDevice:
         return self._bledevice
 
-    def update_device(self):
-        """Update device info from BLE discovery."""
-        for discovery_info in async_discovered_service_info(self._hass):
-            if discovery_info.address == self._address:
-                self._rssi = discovery_info.rssi
+    def update_device(self) -> bool:
+        """Update device info from BLE discovery; True if a new advertisement arrived."""
+        discovery_info = async_last_service_info(self._hass, self._address)
+        if discovery_info is None or discovery_info.time == self._adv_time:
+            return False
+        self._adv_time = discovery_info.time
+        self._rssi = discovery_info.rssi
+        return True
 
 
 class BLEDOMInstance:
-    def __init__(self, address, reset: bool, delay: int, hass) -> None:
-        self.loop = asyncio.get_running_loop()
-        self._address = address
+    # Keep in sync with the attributes assigned in __init__
+    __slots__ = (
+        "_address", "device_identifiers", "device_connections", "device_info", "detected_model",
+        "_reset", "_delay", "_hass", "_device", "_device_data", "_connect_lock",
+        "_client", "_disconnect_timer", "_cached_services", "_expected_disconnect",
+        "_write_queue", "_flush_task", "_next_submit_monotonic",
+        "_is_on", "_rgb_color", "_brightness", "_effect", "_effect_speed",
+        "_color_temp_kelvin", "_mic_effect", "_mic_sensitivity", "_mic_enabled",
+        "_write_uuid", "_read_uuid", "_write_without_response", "_turn_on_cmd", "_turn_off_cmd",
+        "_white_cmd", "_white_bb_idx", "_effect_speed_cmd", "_effect_speed_bb_idx",
+        "_effect_cmd", "_effect_bb_idx", "_color_temp_cmd", "_color_temp_bb_idx",
+        "_color_temp", "_max_color_temp_kelvin", "_min_color_temp_kelvin", "_model",
+        "_working_query_cmd", "_query_detection_done", "_query_cache_path", "_notification_event",
+        "_bleddm_variant_checked", "_rgb_gain_r", "_rgb_gain_g", "_rgb_gain_b",
+        "_gain_lut_r", "_gain_lut_g", "_gain_lut_b",
+        "_brightness_mode", "_rssi_window", "_is_melk", "_is_modelx", "_notify_enabled",
+    )
+
+    def __init__(self, address, reset: bool, delay: int, hass, model: str | None = None) -> None:
+        self._address = address = sys.intern(address)
+        # Shared by the device_info of every entity of this device
+        self.device_identifiers = frozenset({(DOMAIN, address)})
+        self.device_connections = frozenset({(CONNECTION_BLUETOOTH, address)})
         self._reset = reset
         self._delay = delay
         self._hass = hass
@@ -334,6 +522,9 @@ class BLEDOMInstance:
         self._disconnect_timer: asyncio.TimerHandle | None = None
         self._cached_services: BleakGATTServiceCollection | None = None
         self._expected_disconnect = False
+        self._write_queue: deque[tuple[str | None, bytes | bytearray, asyncio.Future[None]]] = deque()
+        self._flush_task: asyncio.Task | None = None
+        self._next_submit_monotonic = 0.0  # loop time before which writes wait
         self._is_on = None
         self._rgb_color = None
         self._brightness = 255
@@ -345,25 +536,36 @@ class BLEDOMInstance:
         self._mic_enabled = False
         self._write_uuid = None
         self._read_uuid = None
+        self._write_without_response = True  # Updated once the characteristic is known
+        self._rssi_window: deque[int] = deque(maxlen=RSSI_WINDOW)  # Recent RSSI samples
         self._turn_on_cmd = None
         self._turn_off_cmd = None
         self._white_cmd = None
+        self._white_bb_idx = -1
         self._effect_speed_cmd = None
+        self._effect_speed_bb_idx = -1
         self._effect_cmd = None
+        self._effect_bb_idx = -1
         self._color_temp_cmd = None
+        self._color_temp_bb_idx = ()
         self._color_temp = None
         self._max_color_temp_kelvin = None
         self._min_color_temp_kelvin = None
         self._model = None
         self._working_query_cmd = None  # Command that works for this device
         self._query_detection_done = False  # Flag to avoid retesting
-        self._notification_received = False  # Flag to detect responses
+        self._query_cache_path: Path | None = None  # Set on first cache access
+        self._notification_event = asyncio.Event()  # Set when the device responds
         self._bleddm_variant_checked = False  # ELK-BLEDDM variant detection done
 
         # Per-device RGB calibration gains (applied to set_color RGB writes only)
         self._rgb_gain_r: float = 1.0
         self._rgb_gain_g: float = 1.0
         self._rgb_gain_b: float = 1.0
+        # Gained output for every 0-255 input, rebuilt by set_rgb_gains
+        self._gain_lut_r: tuple[int, ...] = _IDENTITY_LUT
+        self._gain_lut_g: tuple[int, ...] = _IDENTITY_LUT
+        self._gain_lut_b: tuple[int, ...] = _IDENTITY_LUT
 
         # Brightness mode: "auto", "rgb", or "native"
         self._brightness_mode: str = "auto"
@@ -373,24 +575,45 @@ class BLEDOMInstance:
         except (Exception) as error:
             LOGGER.error("Error getting device: %s", error)
 
-        for discovery_info in async_discovered_service_info(hass):
-            if discovery_info.address == address:
-                devicedata = DeviceData(hass, discovery_info)
-                LOGGER.debug("device %s: %s %s",devicedata.name, devicedata.address, devicedata.rssi)
-                if devicedata.is_supported:
-                    self._device_data = devicedata
+        if discovery_info := async_last_service_info(hass, address):
+            devicedata = DeviceData(hass, discovery_info)
+            LOGGER.debug("device %s: %s %s",devicedata.name, devicedata.address, devicedata.rssi)
+            if devicedata.is_supported:
+                self._device_data = devicedata
 
         if not self._device:
             raise ConfigEntryNotReady(f"You need to add bluetooth integration (https://www.home-assistant.io/integrations/bluetooth) or couldn't find a nearby device with address: {address}")
 
-        self._detect_model()
+        # Device families with special handling, decided once by name
+        device_name_lower = (self._device.name or "").lower()
+        self._is_melk = device_name_lower.startswith("melk")
+        self._is_modelx = device_name_lower.startswith("modelx")
+        # MELK and LEDBLE controllers don't support notifications
+        self._notify_enabled = not (self._is_melk or device_name_lower.startswith("ledble"))
+
+        if model in MODEL_DB:
+            # Model remembered from an earlier setup
+            self._model = model
+            self._load_model_config(MODEL_DB[model])
+        else:
+            model = self._detect_model()
+        # None when the model could only be guessed
+        self.detected_model = model
+        # Shared by every entity of this device
+        self.device_info = DeviceInfo(
+            identifiers=self.device_identifiers,
+            manufacturer="ELK",
+            model=self._model or "BLEDOM",
+            connections=self.device_connections,
+        )
 
         # Apply default RGB gains from MODEL_DB if defined
         model_config = MODEL_DB.get(self._model) if self._model else None
         if model_config and model_config.default_rgb_gains != (1.0, 1.0, 1.0):
             r, g, b = model_config.default_rgb_gains
             self.set_rgb_gains(r, g, b)
-        LOGGER.debug('Model information for device %s : ModelNo %s, Turn on cmd %s, Turn off cmd %s, White cmd %s, rssi %s', self.name, self._model, self._turn_on_cmd, self._turn_off_cmd, self._white_cmd, self.rssi)
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug('Model information for device %s : ModelNo %s, Turn on cmd %s, Turn off cmd %s, White cmd %s, rssi %s', self.name, self._model, self._turn_on_cmd.hex(' '), self._turn_off_cmd.hex(' '), self._white_cmd.hex(' '), self.rssi)
 
     def _detect_model(self):
         """Detect the LED model from the device name and load its configuration."""
@@ -398,44 +621,36 @@ class BLEDOMInstance:
             LOGGER.warning("Device or device name is None, using default configuration")
             first_config = next(iter(MODEL_DB.values()))
             self._model = first_config.name
-            self._turn_on_cmd = list(first_config.turn_on_cmd)
-            self._turn_off_cmd = list(first_config.turn_off_cmd)
-            self._white_cmd = list(first_config.white_cmd)
-            self._effect_speed_cmd = list(first_config.effect_speed_cmd)
-            self._effect_cmd = list(first_config.effect_cmd)
-            self._color_temp_cmd = list(first_config.color_temp_cmd)
-            self._max_color_temp_kelvin = first_config.max_color_temp_k
-            self._min_color_temp_kelvin = first_config.min_color_temp_k
+            self._load_model_config(first_config)
             return None
-        device_name_lower = self._device.name.lower()
-
-        for name, config in MODEL_DB.items():
-            if device_name_lower.startswith(name.lower()):
-                self._model = name
-                self._turn_on_cmd = list(config.turn_on_cmd)
-                self._turn_off_cmd = list(config.turn_off_cmd)
-                self._white_cmd = list(config.white_cmd)
-                self._effect_speed_cmd = list(config.effect_speed_cmd)
-                self._effect_cmd = list(config.effect_cmd)
-                self._color_temp_cmd = list(config.color_temp_cmd)
-                self._max_color_temp_kelvin = config.max_color_temp_k
-                self._min_color_temp_kelvin = config.min_color_temp_k
-                return name
+        if match := _PREFIX_RE.match(self._device.name):
+            name = _PREFIX_LOWER_TO_NAME[match.group(0).lower()]
+            self._model = name
+            self._load_model_config(MODEL_DB[name])
+            return name
 
         # Fallback to first model if no match (shouldn't happen if discovery is working)
         LOGGER.warning("Unknown device model '%s', using default configuration", self.name)
         first_config = next(iter(MODEL_DB.values()))
         self._model = first_config.name
-        self._turn_on_cmd = list(first_config.turn_on_cmd)
-        self._turn_off_cmd = list(first_config.turn_off_cmd)
-        self._white_cmd = list(first_config.white_cmd)
-        self._effect_speed_cmd = list(first_config.effect_speed_cmd)
-        self._effect_cmd = list(first_config.effect_cmd)
-        self._color_temp_cmd = list(first_config.color_temp_cmd)
-        self._max_color_temp_kelvin = first_config.max_color_temp_k
-        self._min_color_temp_kelvin = first_config.min_color_temp_k
+        self._load_model_config(first_config)
         return None
 
+    def _load_model_config(self, config: ModelConfig) -> None:
+        """Use the command templates of the given model."""
+        self._turn_on_cmd = config.turn_on_bytes
+        self._turn_off_cmd = config.turn_off_bytes
+        self._white_cmd = config.white_template
+        self._white_bb_idx = config.white_bb_idx
+        self._effect_speed_cmd = config.effect_speed_template
+        self._effect_speed_bb_idx = config.effect_speed_bb_idx
+        self._effect_cmd = config.effect_template
+        self._effect_bb_idx = config.effect_bb_idx
+        self._color_temp_cmd = config.color_temp_template
+        self._color_temp_bb_idx = config.color_temp_bb_idx
+        self._max_color_temp_kelvin = config.max_color_temp_k
+        self._min_color_temp_kelvin = config.min_color_temp_k
+
     def set_rgb_gains(self, r: float, g: float, b: float) -> None:
         """Set per-channel RGB gains.
 
@@ -448,16 +663,16 @@ class BLEDOMInstance:
             self._rgb_gain_b = max(0.0, float(b))
         except (TypeError, ValueError):
             LOGGER.warning("Invalid RGB gains provided; keeping existing values")
-
-    @staticmethod
-    def _clamp_byte(value: float) -> int:
-        return max(0, min(255, int(round(value))))
+        self._gain_lut_r = _gain_lut(self._rgb_gain_r)
+        self._gain_lut_g = _gain_lut(self._rgb_gain_g)
+        self._gain_lut_b = _gain_lut(self._rgb_gain_b)
 
     def _apply_rgb_gains(self, r: int, g: int, b: int) -> tuple[int, int, int]:
+        # Clamp before indexing: >255 would raise, negatives would wrap
         return (
-            self._clamp_byte(r * self._rgb_gain_r),
-            self._clamp_byte(g * self._rgb_gain_g),
-            self._clamp_byte(b * self._rgb_gain_b),
+            self._gain_lut_r[_clamp(r, 0, 255)],
+            self._gain_lut_g[_clamp(g, 0, 255)],
+            self._gain_lut_b[_clamp(b, 0, 255)],
         )
 
     @property
@@ -476,53 +691,131 @@ class BLEDOMInstance:
 
     def get_white_cmd(self, intensity: int):
         if self._white_cmd is None:
-            return [0x7e, 0x00, 0x01, int(intensity*100/255), 0x00, 0x00, 0x00, 0x00, 0xef]
-        white_cmd = self._white_cmd.copy()
-        bb_index = white_cmd.index(0xbb) if 0xbb in white_cmd else -1
-        if bb_index >= 0:
-            white_cmd[bb_index] = int(intensity*100/255)
+            return bytes((0x7e, 0x00, 0x01, _255_TO_PCT[intensity], 0x00, 0x00, 0x00, 0x00, 0xef))
+        white_cmd = bytearray(self._white_cmd)
+        if self._white_bb_idx >= 0:
+            white_cmd[self._white_bb_idx] = _255_TO_PCT[intensity]
         return white_cmd
 
     def get_effect_speed_cmd(self, value: int):
         if self._effect_speed_cmd is None:
-            return [0x7e, 0x00, 0x02, int(value), 0x00, 0x00, 0x00, 0x00, 0xef]
-        effect_speed_cmd = self._effect_speed_cmd.copy()
-        bb_index = effect_speed_cmd.index(0xbb) if 0xbb in effect_speed_cmd else -1
-        if bb_index >= 0:
-            effect_speed_cmd[bb_index] = int(value)
+            return bytes((0x7e, 0x00, 0x02, int(value), 0x00, 0x00, 0x00, 0x00, 0xef))
+        effect_speed_cmd = bytearray(self._effect_speed_cmd)
+        if self._effect_speed_bb_idx >= 0:
+            effect_speed_cmd[self._effect_speed_bb_idx] = int(value)
         return effect_speed_cmd
 
     def get_effect_cmd(self, value: int):
         if self._effect_cmd is None:
-            return [0x7e, 0x00, 0x03, int(value), 0x03, 0x00, 0x00, 0x00, 0xef]
-        effect_cmd = self._effect_cmd.copy()
-        bb_index = effect_cmd.index(0xbb) if 0xbb in effect_cmd else -1
-        if bb_index >= 0:
-            effect_cmd[bb_index] = int(value)
+            return bytes((0x7e, 0x00, 0x03, int(value), 0x03, 0x00, 0x00, 0x00, 0xef))
+        effect_cmd = bytearray(self._effect_cmd)
+        if self._effect_bb_idx >= 0:
+            effect_cmd[self._effect_bb_idx] = int(value)
         return effect_cmd
 
     def get_color_temp_cmd(self, warm: int, cold: int):
         if self._color_temp_cmd is None:
-            return [0x7e, 0x00, 0x04, int(warm), int(cold), 0x00, 0x00, 0x00, 0xef]
-        color_temp_cmd = self._color_temp_cmd.copy()
-        # Find all 0xbb positions
-        bb_indices = [i for i, v in enumerate(color_temp_cmd) if v == 0xbb]
-        if len(bb_indices) >= 2:
-            color_temp_cmd[bb_indices[0]] = int(warm)
-            color_temp_cmd[bb_indices[1]] = int(cold)
+            return bytes((0x7e, 0x00, 0x04, int(warm), int(cold), 0x00, 0x00, 0x00, 0xef))
+        color_temp_cmd = bytearray(self._color_temp_cmd)
+        if self._color_temp_bb_idx:
+            warm_idx, cold_idx = self._color_temp_bb_idx
+            color_temp_cmd[warm_idx] = int(warm)
+            color_temp_cmd[cold_idx] = int(cold)
         return color_temp_cmd
 
-    async def _write(self, data: list[int] | bytearray):
-        """Send command to device and read response."""
-        await self._ensure_connected()
-        await self._write_while_connected(data)
+    async def _write(self, data: bytes | bytearray, kind: str | None = None):
+        """Queue a command for the device and wait until it has been sent.
+
+        Commands tagged with a kind replace any queued command of the same
+        kind that has not been sent yet, so the device only receives the
+        latest target when the UI floods us with updates. Callers whose
+        command was replaced return as soon as it is dropped.
+        """
+        sent = self._enqueue_write(kind, data)
+        self._start_flush()
+        # Shield so a cancelled caller does not abort its queued write
+        await asyncio.shield(sent)
+
+    async def _write_batch(self, commands: Iterable[tuple[str | None, bytes | bytearray]]) -> None:
+        """Queue several (kind, data) commands and wait until all were sent.
 
-    async def _write_while_connected(self, data: list[int] | bytearray):
-        LOGGER.debug(''.join(format(x, ' 03x') for x in data))
+        The commands go out back to back in a single flush, without
+        write-with-response round trips or caller wake-ups in between.
+        """
+        waiters = [self._enqueue_write(kind, data) for kind, data in commands]
+        self._start_flush()
+        await asyncio.shield(asyncio.gather(*waiters))
+
+    def _enqueue_write(self, kind: str | None, data: bytes | bytearray) -> asyncio.Future[None]:
+        """Queue a command and return the future resolved once it is sent.
+
+        A queued command of the same kind is superseded in place, so
+        commands of different kinds keep the order they were issued in.
+        """
+        sent = asyncio.get_running_loop().create_future()
+        entry = (kind, data, sent)
+        if kind is not None:
+            queue = self._write_queue
+            for index, queued in enumerate(queue):
+                if queued[0] == kind:
+                    queue[index] = entry
+                    # Release the caller of the superseded command
+                    if not queued[2].done():
+                        queued[2].set_result(None)
+                    return sent
+        self._write_queue.append(entry)
+        return sent
+
+    def _start_flush(self) -> asyncio.Task:
+        """Start flushing the write queue unless a flush is already running."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_write_queue())
+        return self._flush_task
+
+    async def _flush_write_queue(self) -> None:
+        """Wait for the burst to settle, then write every queued command.
+
+        Errors are handed to the callers of the affected commands rather
+        than raised from the flush task.
+        """
+        loop = asyncio.get_running_loop()
+        sent = None
+        try:
+            await asyncio.sleep(max(WRITE_FLUSH_DELAY, self._next_submit_monotonic - loop.time()))
+            await self._ensure_connected()
+            while self._write_queue:
+                _kind, data, sent = self._write_queue.popleft()
+                await self._write_while_connected(data)
+                self._next_submit_monotonic = 0.0
+                if not sent.done():
+                    sent.set_result(None)
+                sent = None
+        except BaseException as err:
+            pending = [entry[2] for entry in self._write_queue]
+            self._write_queue.clear()
+            if sent is not None:
+                pending.append(sent)
+            if not isinstance(err, Exception):
+                for fut in pending:
+                    fut.cancel()
+                raise
+            self._next_submit_monotonic = loop.time() + WRITE_BACKOFF_TIME
+            # Callers retry their own command, fail what is left
+            for fut in pending:
+                if not fut.done():
+                    fut.set_exception(err)
+
+    @property
+    def write_backoff_active(self) -> bool:
+        """Return True while writes are held back after a failure."""
+        return asyncio.get_running_loop().time() < self._next_submit_monotonic
+
+    async def _write_while_connected(self, data: bytes | bytearray):
         if self._client is None:
             raise RuntimeError("BLE client not connected")
-        write_data = bytearray(data) if isinstance(data, list) else data
-        await self._client.write_gatt_char(self._write_uuid, write_data, False)
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("%s", data.hex(' '))
+        await self._client.write_gatt_char(self._write_uuid, data, response=not self._write_without_response)
 
     @property
     def address(self):
@@ -592,7 +885,7 @@ class BLEDOMInstance:
         warm = value
         cold = 100 - value
         color_temp_cmd = self.get_color_temp_cmd(warm, cold)
-        await self._write(color_temp_cmd)
+        await self._write(color_temp_cmd, "color_temp")
         self._color_temp = warm
 
     @retry_bluetooth_connection_error
@@ -613,6 +906,7 @@ class BLEDOMInstance:
         # Ensure brightness is not None before using it
         if brightness is None:
             brightness = self._brightness if self._brightness is not None else 255
+        brightness = _clamp(int(brightness), 0, 255)
         self._brightness = brightness
 
         # Try native CCT command first if device has color temp command
@@ -620,36 +914,17 @@ class BLEDOMInstance:
             try:
                 color_temp_percent = int(((value - min_temp) * 100) /
                                         (max_temp - min_temp)) if max_temp > min_temp else 50
-                brightness_percent = int(brightness * 100 / 255)
+                brightness_percent = _255_TO_PCT[brightness]
                 color_temp_cmd = self.get_color_temp_cmd(color_temp_percent, brightness_percent)
-                await self._write(color_temp_cmd)
+                await self._write(color_temp_cmd, "color_temp")
                 LOGGER.debug("Used native CCT command for %dK", value)
                 return
             except Exception as e:
                 LOGGER.debug("Native CCT command failed, falling back to RGB emulation: %s", e)
 
         # RGB emulation fallback (for RGB-only devices)
-        # Interpolate between warm white (2700K) and cool white (6500K) using RGB
-        # Warm: amber-orange tint, Cool: slight blue tint
-        # Values based on common RGB LED color temperature emulation
-        warm_rgb = (255, 138, 18)   # ~1800K - very warm/orange
-        cool_rgb = (180, 220, 255)  # ~7000K - cool/blue-white
-
-        # Normalize to 0-1 range
-        k_min = min_temp
-        k_max = max_temp
-        t = (value - k_min) / (k_max - k_min) if k_max > k_min else 1.0
-
-        # Linear interpolation
-        r = int(warm_rgb[0] + (cool_rgb[0] - warm_rgb[0]) * t)
-        g = int(warm_rgb[1] + (cool_rgb[1] - warm_rgb[1]) * t)
-        b = int(warm_rgb[2] + (cool_rgb[2] - warm_rgb[2]) * t)
-
-        # Apply brightness scaling
-        scale = brightness / 255.0
-        r = int(r * scale)
-        g = int(g * scale)
-        b = int(b * scale)
+        pct = int((value - min_temp) * 100 // (max_temp - min_temp)) if max_temp > min_temp else 100
+        r, g, b = _cct_rgb(pct, brightness)
 
         LOGGER.debug("RGB emulation for %dK: RGB(%d, %d, %d) at brightness %d", value, r, g, b, brightness)
         await self.set_color((r, g, b))
@@ -657,34 +932,46 @@ class BLEDOMInstance:
     @retry_bluetooth_connection_error
     async def set_color(self, rgb: tuple[int, int, int]):
         r, g, b = rgb
+        # _apply_rgb_gains clamps each channel to 0-255
         rr, gg, bb = self._apply_rgb_gains(int(r), int(g), int(b))
-        await self._write([0x7e, 0x00, 0x05, 0x03, rr, gg, bb, 0x00, 0xef])
+        await self._write(bytes((0x7e, 0x00, 0x05, 0x03, rr, gg, bb, 0x00, 0xef)), "color")
         self._rgb_color = rgb
 
     @retry_bluetooth_connection_error
     async def set_white(self, intensity: int):
         if intensity is None:
             intensity = 255  # Valor por defecto si no se especifica
+        intensity = _clamp(int(intensity), 0, 255)
         white_cmd = self.get_white_cmd(intensity)
-        await self._write(white_cmd)
+        await self._write(white_cmd, "white")
         self._brightness = intensity
 
     @retry_bluetooth_connection_error
     async def set_brightness(self, intensity: int):
-        await self._write([0x7e, 0x04, 0x01, int(intensity*100/255), 0xff, 0x00, 0xff, 0x00, 0xef])
+        intensity = _clamp(int(intensity), 0, 255)
+        await self._write(bytes((0x7e, 0x04, 0x01, _255_TO_PCT[intensity], 0xff, 0x00, 0xff, 0x00, 0xef)), "brightness")
         self._brightness = intensity
 
     @retry_bluetooth_connection_error
     async def set_effect_speed(self, value: int):
+        value = _clamp(int(value), 0, 255)
         effect_speed = self.get_effect_speed_cmd(value)
-        await self._write(effect_speed)
+        await self._write(effect_speed, "effect_speed")
         self._effect_speed = value
 
     @retry_bluetooth_connection_error
-    async def set_effect(self, value: int):
-        effect = self.get_effect_cmd(value)
-        await self._write(effect)
+    async def set_effect(self, value: int, speed: int | None = None):
+        """Set an effect, sending the effect speed in the same batch if given."""
+        value = _clamp(int(value), 0, 255)
+        if speed is not None:
+            speed = _clamp(int(speed), 0, 255)
+        commands = [("effect", self.get_effect_cmd(value))]
+        if speed is not None:
+            commands.append(("effect_speed", self.get_effect_speed_cmd(speed)))
+        await self._write_batch(commands)
         self._effect = value
+        if speed is not None:
+            self._effect_speed = speed
 
     @retry_bluetooth_connection_error
     async def set_mic_effect(self, value: int):
@@ -692,31 +979,29 @@ class BLEDOMInstance:
         if not 0x80 <= value <= 0x87:
             LOGGER.warning("Invalid mic effect value: 0x%02x, must be between 0x80 and 0x87", value)
             return
-        await self._write([0x7e, 0x05, 0x03, value, 0x04, 0xff, 0xff, 0x00, 0xef])
+        await self._write(bytes((0x7e, 0x05, 0x03, value, 0x04, 0xff, 0xff, 0x00, 0xef)), "mic_effect")
         self._mic_effect = value
         LOGGER.debug("Mic effect set to: 0x%02x", value)
 
     @retry_bluetooth_connection_error
     async def set_mic_sensitivity(self, value: int):
         """Set microphone sensitivity (0-100)."""
-        if not 0 <= value <= 100:
-            LOGGER.warning("Invalid mic sensitivity value: %d, must be between 0 and 100", value)
-            return
-        await self._write([0x7e, 0x04, 0x06, value, 0xff, 0xff, 0xff, 0x00, 0xef])
+        value = _clamp(int(value), 0, 100)
+        await self._write(bytes((0x7e, 0x04, 0x06, value, 0xff, 0xff, 0xff, 0x00, 0xef)), "mic_sensitivity")
         self._mic_sensitivity = value
         LOGGER.debug("Mic sensitivity set to: %d", value)
 
     @retry_bluetooth_connection_error
     async def enable_mic(self):
         """Enable external microphone."""
-        await self._write([0x7e, 0x04, 0x07, 0x01, 0xff, 0xff, 0xff, 0x00, 0xef])
+        await self._write(_CMD_MIC_ENABLE, "mic")
         self._mic_enabled = True
         LOGGER.debug("External microphone enabled")
 
     @retry_bluetooth_connection_error
     async def disable_mic(self):
         """Disable external microphone."""
-        await self._write([0x7e, 0x04, 0x07, 0x00, 0xff, 0xff, 0xff, 0x00, 0xef])
+        await self._write(_CMD_MIC_DISABLE, "mic")
         self._mic_enabled = False
         LOGGER.debug("External microphone disabled")
 
@@ -728,101 +1013,206 @@ class BLEDOMInstance:
         # ELK-BLEDDM: detect which variant works on first call
         if self._model == "ELK-BLEDDM" and not self._bleddm_variant_checked:
             self._bleddm_variant_checked = True
-            self._notification_received = False
+            variant = await self._load_power_variant()
+            if variant == "alt":
+                self._use_bleddm_alt_power_cmds()
+            # Probe writes are untagged so a later power command can't
+            # supersede them unsent and fake a missing reply
+            self._notification_event.clear()
             await self._write(self._turn_on_cmd)
-            await asyncio.sleep(0.3)
-            if not self._notification_received:
-                LOGGER.debug("%s: Primary cmd no response, trying alternate", self.name)
-                bleddm_config = MODEL_DB["ELK-BLEDDM"]
-                if bleddm_config.alt_turn_on_cmd is not None:
-                    self._turn_on_cmd = list(bleddm_config.alt_turn_on_cmd)
-                if bleddm_config.alt_turn_off_cmd is not None:
-                    self._turn_off_cmd = list(bleddm_config.alt_turn_off_cmd)
+            if await self._wait_for_notification(0.3):
+                detected = variant or "primary"
+            elif variant == "alt":
+                # Make sure the cached variant didn't come from a missed reply
+                LOGGER.debug("%s: Cached alternate cmd no response, trying primary", self.name)
+                self._use_bleddm_primary_power_cmds()
+                self._notification_event.clear()
                 await self._write(self._turn_on_cmd)
+                if await self._wait_for_notification(0.3):
+                    detected = "primary"
+                else:
+                    detected = "alt"
+                    self._use_bleddm_alt_power_cmds()
+            else:
+                LOGGER.debug("%s: Primary cmd no response, trying alternate", self.name)
+                self._use_bleddm_alt_power_cmds()
+                await self._write(self._turn_on_cmd, "power")
+                detected = "alt"
+            if detected != variant:
+                await self._save_power_variant(detected)
         else:
-            await self._write(self._turn_on_cmd)
+            await self._write(self._turn_on_cmd, "power")
         self._is_on = True
 
+    def _use_bleddm_primary_power_cmds(self) -> None:
+        """Switch back to the standard ELK-BLEDDM power commands."""
+        bleddm_config = MODEL_DB["ELK-BLEDDM"]
+        self._turn_on_cmd = bleddm_config.turn_on_bytes
+        self._turn_off_cmd = bleddm_config.turn_off_bytes
+
+    def _use_bleddm_alt_power_cmds(self) -> None:
+        """Switch to the alternate ELK-BLEDDM power commands."""
+        bleddm_config = MODEL_DB["ELK-BLEDDM"]
+        if bleddm_config.alt_turn_on_bytes is not None:
+            self._turn_on_cmd = bleddm_config.alt_turn_on_bytes
+        if bleddm_config.alt_turn_off_bytes is not None:
+            self._turn_off_cmd = bleddm_config.alt_turn_off_bytes
+
     @retry_bluetooth_connection_error
     async def turn_off(self):
         if self._turn_off_cmd is None:
             LOGGER.error("%s: Turn off command not configured", self.name)
             return
-        await self._write(self._turn_off_cmd)
+        await self._write(self._turn_off_cmd, "power")
         self._is_on = False
 
     @retry_bluetooth_connection_error
     async def set_scheduler_on(self, days: int, hours: int, minutes: int, enabled: bool):
+        days, hours, minutes = _clamp(days, 0, 0x7f), _clamp(hours, 0, 23), _clamp(minutes, 0, 59)
         if enabled:
             value = days + 0x80
         else:
             value = days
-        await self._write([0x7e, 0x00, 0x82, hours, minutes, 0x00, 0x00, value, 0xef])
+        await self._write(bytes((0x7e, 0x00, 0x82, hours, minutes, 0x00, 0x00, value, 0xef)), "scheduler_on")
 
     @retry_bluetooth_connection_error
     async def set_scheduler_off(self, days: int, hours: int, minutes: int, enabled: bool):
+        days, hours, minutes = _clamp(days, 0, 0x7f), _clamp(hours, 0, 23), _clamp(minutes, 0, 59)
         if enabled:
             value = days + 0x80
         else:
             value = days
-        await self._write([0x7e, 0x00, 0x82, hours, minutes, 0x00, 0x01, value, 0xef])
+        await self._write(bytes((0x7e, 0x00, 0x82, hours, minutes, 0x00, 0x01, value, 0xef)), "scheduler_off")
 
     @retry_bluetooth_connection_error
     async def sync_time(self):
         now = datetime.now()
-        day_of_week = now.isoweekday()
-        await self._write([0x7e, 0x00, 0x83, int(now.strftime('%H')), int(now.strftime('%M')), int(now.strftime('%S')), day_of_week, 0x00, 0xef])
+        _SYNC_TIME_FIELDS[:] = bytes((now.hour, now.minute, now.second, now.isoweekday()))
+        await self._write(bytes(_SYNC_TIME_TEMPLATE), "time")
 
     @retry_bluetooth_connection_error
     async def custom_time(self, hour: int, minute: int, second: int, day_of_week: int):
-        await self._write([0x7e, 0x00, 0x83, hour, minute, second, day_of_week, 0x00, 0xef])
+        frame = (_clamp(hour, 0, 23), _clamp(minute, 0, 59), _clamp(second, 0, 59), _clamp(day_of_week, 1, 7))
+        await self._write(bytes((0x7e, 0x00, 0x83, *frame, 0x00, 0xef)), "time")
 
     def _get_query_cache_file(self) -> Path:
         """Get path to query command cache file."""
-        # Store in Home Assistant config directory
-        config_dir = Path(self._hass.config.path())
-        cache_dir = config_dir / "custom_components" / "elkbledom" / ".cache"
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        return cache_dir / "query_commands.json"
+        if self._query_cache_path is None:
+            # Store in Home Assistant config directory
+            config_dir = Path(self._hass.config.path())
+            cache_dir = config_dir / "custom_components" / "elkbledom" / ".cache"
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            self._query_cache_path = cache_dir / "query_commands.json"
+        return self._query_cache_path
+
+    def _read_query_cache_sync(self, known_mtime: float | None) -> tuple[float | None, dict | None]:
+        """Read the query command cache file; runs in the executor.
+
+        Returns the file's mtime and its contents, or None for the
+        contents when the mtime still matches known_mtime.
+        """
+        cache_file = self._get_query_cache_file()
+        try:
+            mtime = cache_file.stat().st_mtime
+        except FileNotFoundError:
+            return None, {}
+        if mtime == known_mtime:
+            return mtime, None
+        with open(cache_file) as f:
+            return mtime, json.load(f)
+
+    def _write_query_cache_sync(self, cache: dict) -> float:
+        """Write the query command cache file; runs in the executor."""
+        # Write to a temporary file first so a crash can't leave a
+        # truncated cache behind
+        cache_file = self._get_query_cache_file()
+        tmp_file = cache_file.with_suffix(".tmp")
+        with open(tmp_file, 'w') as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp_file, cache_file)
+        return cache_file.stat().st_mtime
+
+    async def _read_query_cache(self) -> dict:
+        """Return the parsed query cache, re-reading it only if the file changed."""
+        # Devices starting together wait for one read instead of each
+        # parsing the file
+        async with _QUERY_CACHE_LOCK:
+            return await self._read_query_cache_locked()
+
+    async def _read_query_cache_locked(self) -> dict:
+        """Return the parsed query cache; _QUERY_CACHE_LOCK must be held."""
+        snapshot = _QUERY_CACHE_SNAPSHOT
+        mtime, cache = await self._hass.async_add_executor_job(
+            self._read_query_cache_sync, snapshot.mtime
+        )
+        if cache is not None:
+            snapshot.data, snapshot.mtime = cache, mtime
+        return snapshot.data
 
-    def _load_working_query_cmd(self) -> bool:
+    async def _load_working_query_cmd(self) -> bool:
         """Load previously detected working query command."""
         try:
-            cache_file = self._get_query_cache_file()
-            if cache_file.exists():
-                with open(cache_file) as f:
-                    cache = json.load(f)
-                    device_key = f"{self.name}_{self._model}"
-                    if device_key in cache:
-                        self._working_query_cmd = cache[device_key]["command"]
-                        cmd_desc = cache[device_key]["description"]
-                        LOGGER.info("%s: Loaded cached query command: %s", self.name, cmd_desc)
-                        return True
+            cache = await self._read_query_cache()
+            device_key = f"{self.name}_{self._model}"
+            if device_key in cache:
+                self._working_query_cmd = bytes(cache[device_key]["command"])
+                cmd_desc = cache[device_key]["description"]
+                LOGGER.info("%s: Loaded cached query command: %s", self.name, cmd_desc)
+                return True
         except Exception as e:
             LOGGER.debug("%s: Could not load query cache: %s", self.name, e)
         return False
 
-    def _save_working_query_cmd(self, cmd: list, description: str) -> None:
+    async def _save_working_query_cmd(self, cmd: bytes, description: str) -> None:
         """Save working query command to cache."""
+        device_key = f"{self.name}_{self._model}"
+        entry = {
+            "command": list(cmd),
+            "description": description,
+            "device_name": self.name,
+            "model": self._model
+        }
         try:
-            cache_file = self._get_query_cache_file()
-            cache = {}
-            if cache_file.exists():
-                with open(cache_file) as f:
-                    cache = json.load(f)
+            if not await self._store_query_cache_entry(device_key, entry):
+                return
+        except Exception as e:
+            LOGGER.warning("%s: Could not save query cache: %s", self.name, e)
+            return
+        LOGGER.info("%s: Saved working query command: %s", self.name, description)
+
+    async def _store_query_cache_entry(self, key: str, entry: dict) -> bool:
+        """Store one entry in the cache file; False if it was already there."""
+        # All devices share one file; serialize the read-modify-write
+        async with _QUERY_CACHE_LOCK:
+            cache = await self._read_query_cache_locked()
+            if cache.get(key) == entry:
+                return False
+            # The snapshot is shared, so write a copy
+            cache = {**cache, key: entry}
+            mtime = await self._hass.async_add_executor_job(self._write_query_cache_sync, cache)
+            _QUERY_CACHE_SNAPSHOT.data, _QUERY_CACHE_SNAPSHOT.mtime = cache, mtime
+        return True
 
-            device_key = f"{self.name}_{self._model}"
-            cache[device_key] = {
-                "command": cmd,
-                "description": description,
-                "device_name": self.name,
-                "model": self._model
-            }
+    @property
+    def _power_variant_key(self) -> str:
+        # Per device: ELK-BLEDDM strips share a name but not a power command
+        return f"{self.address}_power"
 
-            with open(cache_file, 'w') as f:
-                json.dump(cache, f, indent=2)
+    async def _load_power_variant(self) -> str | None:
+        """Return the cached ELK-BLEDDM power command variant, if any."""
+        try:
+            cache = await self._read_query_cache()
+        except Exception as e:
+            LOGGER.debug("%s: Could not load query cache: %s", self.name, e)
+            return None
+        entry = cache.get(self._power_variant_key)
+        return entry.get("variant") if isinstance(entry, dict) else None
 
-            LOGGER.info("%s: Saved working query command: %s", self.name, description)
+    async def _save_power_variant(self, variant: str) -> None:
+        """Remember which ELK-BLEDDM power command variant the device uses."""
+        entry = {"variant": variant, "device_name": self.name, "model": self._model}
+        try:
+            await self._store_query_cache_entry(self._power_variant_key, entry)
         except Exception as e:
             LOGGER.warning("%s: Could not save query cache: %s", self.name, e)
 
@@ -847,7 +1237,7 @@ class BLEDOMInstance:
             return
 
         # Try to load from cache first
-        if self._load_working_query_cmd():
+        if await self._load_working_query_cmd():
             self._query_detection_done = True
             # Test it
             try:
@@ -859,22 +1249,22 @@ class BLEDOMInstance:
             return
 
         # Auto-detection: try each command and see which gets a response
+        query_commands = QUERY_COMMANDS_BY_MODEL.get(self._model, ()) + QUERY_COMMANDS_BY_MODEL["*"]
         LOGGER.info("%s: Auto-detecting working query command (testing %d commands)...",
-                    self.name, len(QUERY_COMMANDS))
+                    self.name, len(query_commands))
 
-        for cmd, description in QUERY_COMMANDS:
+        for cmd, description in query_commands:
             try:
-                self._notification_received = False
-                LOGGER.debug("%s: Testing: %s -> %s", self.name, description,
-                           ' '.join(f'{x:02x}' for x in cmd))
+                self._notification_event.clear()
+                if LOGGER.isEnabledFor(logging.DEBUG):
+                    LOGGER.debug("%s: Testing: %s -> %s", self.name, description, cmd.hex(' '))
 
                 await self._write_while_connected(cmd)
-                await asyncio.sleep(0.4)  # Wait for response
 
-                if self._notification_received:
+                if await self._wait_for_notification(0.4):
                     LOGGER.info("%s: ✓ Found working command: %s", self.name, description)
                     self._working_query_cmd = cmd
-                    self._save_working_query_cmd(cmd, description)
+                    await self._save_working_query_cmd(cmd, description)
                     self._query_detection_done = True
                     return
 
@@ -897,14 +1287,28 @@ class BLEDOMInstance:
                 self._color_temp_kelvin = 5000
                 self._brightness = 255
 
-            if self._device_data is not None:
-                self._device_data.update_device()
-
         except Exception as error:
             self._is_on = False
             LOGGER.error("Error getting status: %s", error)
-            track = traceback.format_exc()
-            LOGGER.debug(track)
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug(traceback.format_exc())
+
+    def update_rssi(self) -> None:
+        """Refresh the RSSI from the last received advertisement."""
+        if self._device_data is None:
+            return
+        # Sample each advertisement once, so the mean doesn't fill up with
+        # repeats of a stale reading
+        if self._device_data.update_device() or not self._rssi_window:
+            if (rssi := self._device_data.rssi) is not None:
+                self._rssi_window.append(rssi)
+
+    @property
+    def rssi_smoothed(self) -> int | None:
+        """Return the mean of the recent RSSI samples."""
+        if not self._rssi_window:
+            return None
+        return round(sum(self._rssi_window) / len(self._rssi_window))
 
     async def _ensure_connected(self) -> None:
         """Ensure connection to device is established."""
@@ -943,8 +1347,9 @@ class BLEDOMInstance:
             if not resolved:
                 # Try to handle services failing to load
                 try:
-                    resolved = self._resolve_characteristics(await client.get_services())
-                    self._cached_services = client.get_services() if resolved else None
+                    services = await client.get_services()
+                    resolved = self._resolve_characteristics(services)
+                    self._cached_services = services if resolved else None
                 except (AttributeError):
                     LOGGER.warning("%s: Could not resolve characteristics from services; RSSI: %s", self.name, self.rssi)
             else:
@@ -966,8 +1371,7 @@ class BLEDOMInstance:
 
             # Enable notifications (simple method, no manual CCCD)
             try:
-                device_name_lower = self._device.name.lower() if self._device and self._device.name else ""
-                if not device_name_lower.startswith("melk") and not device_name_lower.startswith("ledble"):
+                if self._notify_enabled:
                     if self._read_uuid is not None and self._read_uuid != "None":
                         LOGGER.debug("%s: Enabling notifications; RSSI: %s", self.name, self.rssi)
                         await client.start_notify(self._read_uuid, self._notification_handler)
@@ -979,70 +1383,77 @@ class BLEDOMInstance:
 
     async def _login_command(self):
         try:
-            device_name_lower = self._device.name.lower() if self._device and self._device.name else ""
-            if device_name_lower.startswith("modelx"):
+            if self._is_modelx:
                 LOGGER.debug("Executing login command for: %s; RSSI: %s", self.name, self.rssi)
-                await self._write([0x7e, 0x07, 0x83])
+                # Called from _ensure_connected while the client is already
+                # set, so write directly instead of going through the queue.
+                await self._write_while_connected(_CMD_LOGIN_1)
                 await asyncio.sleep(1)
-                await self._write([0x7e, 0x04, 0x04])
+                await self._write_while_connected(_CMD_LOGIN_2)
                 await asyncio.sleep(1)
             else:
                 LOGGER.debug("login command for: %s not needed; RSSI: %s", self.name, self.rssi)
 
         except Exception as error:
             LOGGER.error("Error login command: %s", error)
-            track = traceback.format_exc()
-            LOGGER.debug(track)
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug(traceback.format_exc())
 
     async def _init_command(self):
         try:
-            device_name_lower = self._device.name.lower() if self._device and self._device.name else ""
-            if device_name_lower.startswith("melk"):
+            if self._is_melk:
                 LOGGER.debug("Executing init command for: %s; RSSI: %s", self.name, self.rssi)
-                await self._write([0x7e, 0x07, 0x83])
+                await self._write(_CMD_LOGIN_1)
                 await asyncio.sleep(1)
-                await self._write([0x7e, 0x04, 0x04])
+                await self._write(_CMD_LOGIN_2)
                 await asyncio.sleep(1)
             else:
                 LOGGER.debug("init command for: %s not needed; RSSI: %s", self.name, self.rssi)
 
         except Exception as error:
             LOGGER.error("Error login command: %s", error)
-            track = traceback.format_exc()
-            LOGGER.debug(track)
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug(traceback.format_exc())
+
+    async def _wait_for_notification(self, timeout: float) -> bool:
+        """Wait until a notification arrives, returning False after timeout seconds."""
+        try:
+            await asyncio.wait_for(self._notification_event.wait(), timeout)
+        except TimeoutError:
+            return False
+        return True
 
     def _notification_handler(self, _sender: BleakGATTCharacteristic, data: bytearray) -> None:
         """Handle notification responses."""
-        self._notification_received = True  # Mark that we got a response
-        LOGGER.info("%s: ✓ Notification received (%d bytes): %s", self.name, len(data), ' '.join(f'{x:02x}' for x in data))
+        self._notification_event.set()  # Wake anyone waiting for a response
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("%s: Notification received (%d bytes): %s", self.name, len(data), data.hex(' '))
 
         # Parse notification data if available
-        if len(data) >= 9 and data[0] == 0x7e and data[8] == 0xef:
+        if len(data) < _STATUS_FRAME.size:
+            return
+        header, cmd_type, power_state, r, g, b, brightness_percent, tail = _STATUS_FRAME.unpack_from(data)
+        if header == 0x7e and tail == 0xef:
             # Valid response packet
-            cmd_type = data[2]
 
             # Status response (0x01)
             if cmd_type == 0x01:
                 # Power state might be in data[3]
-                power_state = data[3]
-                if power_state in [0x23, 0xf0, 0x01]:
+                if power_state in (0x23, 0xf0, 0x01):
                     self._is_on = True
                     LOGGER.debug("%s: Parsed power state: ON", self.name)
-                elif power_state in [0x24, 0x00]:
+                elif power_state in (0x24, 0x00):
                     self._is_on = False
                     LOGGER.debug("%s: Parsed power state: OFF", self.name)
 
                 # Try to parse RGB color if available
-                if len(data) >= 8:
-                    r, g, b = data[4], data[5], data[6]
-                    if r != 0xff or g != 0xff or b != 0xff:  # Not default/invalid values
-                        self._rgb_color = (r, g, b)
-                        LOGGER.debug("%s: Parsed RGB color: (%d, %d, %d)", self.name, r, g, b)
+                if r != 0xff or g != 0xff or b != 0xff:  # Not default/invalid values
+                    self._rgb_color = (r, g, b)
+                    LOGGER.debug("%s: Parsed RGB color: (%d, %d, %d)", self.name, r, g, b)
 
                 # Brightness might be in data[7]
-                if len(data) >= 8 and data[7] != 0xff:
-                    brightness_percent = data[7]
-                    self._brightness = int(brightness_percent * 255 / 100)
+                if brightness_percent != 0xff:
+                    self._brightness = _PCT_TO_255[min(brightness_percent, 100)]
                     LOGGER.debug("%s: Parsed brightness: %d%%", self.name, brightness_percent)
 
         return
@@ -1052,19 +1463,25 @@ class BLEDOMInstance:
         if not services:
             LOGGER.debug("%s: No services provided to resolve characteristics, dont should works", self.name)
 
-        # Log all available characteristics for debugging
-        LOGGER.debug("%s: Available services and characteristics:", self.name)
-        for service in services:
-            LOGGER.debug("%s: Service %s", self.name, service.uuid)
+        # Index all characteristics by UUID in one pass over the services
+        debug = LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            LOGGER.debug("%s: Available services and characteristics:", self.name)
+        present: dict[str, BleakGATTCharacteristic] = {}
+        for service in services or ():
+            if debug:
+                LOGGER.debug("%s: Service %s", self.name, service.uuid)
             for char in service.characteristics:
-                LOGGER.debug("%s:   Characteristic %s (properties: %s)", self.name, char.uuid, char.properties)
+                if debug:
+                    LOGGER.debug("%s:   Characteristic %s (properties: %s)", self.name, char.uuid, char.properties)
+                present.setdefault(char.uuid.lower(), char)
 
         # Get unique UUIDs from MODEL_DB
         read_uuids, write_uuids = get_all_characteristic_uuids()
 
         # Try to find read characteristic
         for characteristic in read_uuids:
-            if char := services.get_characteristic(characteristic):
+            if char := present.get(characteristic):
                 self._read_uuid = char.uuid
                 LOGGER.debug("%s: Found read UUID: %s with handle %s", self.name, self._read_uuid, char.handle if hasattr(char, 'handle') else 'Unknown')
                 break
@@ -1074,21 +1491,17 @@ class BLEDOMInstance:
 
         # Try to find write characteristic
         for characteristic in write_uuids:
-            if char := services.get_characteristic(characteristic):
+            if char := present.get(characteristic):
                 self._write_uuid = char.uuid
                 LOGGER.debug("%s: Found write UUID: %s with handle %s", self.name, self._write_uuid, char.handle if hasattr(char, 'handle') else 'Unknown')
+                self._write_without_response = "write-without-response" in char.properties
+                if not self._write_without_response:
+                    LOGGER.warning("%s: Write characteristic %s does not advertise write-without-response, writing with response (properties: %s)", self.name, char.uuid, char.properties)
                 if self.name == "ELK-BLEDOM" and char.handle if hasattr(char, 'handle') else 'Unknown' == 0x000d:
                     LOGGER.debug("%s: Adjusting model for ELK-BLEDOM specific handle issue", self.name)
                     # Use ELK-BLEDDM config for this edge case
                     config = MODEL_DB["ELK-BLEDDM"]
-                    self._turn_on_cmd = list(config.turn_on_cmd)
-                    self._turn_off_cmd = list(config.turn_off_cmd)
-                    self._white_cmd = list(config.white_cmd)
-                    self._effect_speed_cmd = list(config.effect_speed_cmd)
-                    self._effect_cmd = list(config.effect_cmd)
-                    self._color_temp_cmd = list(config.color_temp_cmd)
-                    self._max_color_temp_kelvin = config.max_color_temp_k
-                    self._min_color_temp_kelvin = config.min_color_temp_k
+                    self._load_model_config(config)
                 break
 
         if not self._write_uuid:
@@ -1103,7 +1516,7 @@ class BLEDOMInstance:
         self._expected_disconnect = False
         if self._delay is not None and self._delay != 0:
             LOGGER.debug("%s: Configured disconnect from device in %s seconds; RSSI: %s", self.name, self._delay, self.rssi)
-            self._disconnect_timer = self.loop.call_later(
+            self._disconnect_timer = asyncio.get_running_loop().call_later(
                 self._delay, self._disconnect
             )
 
@@ -1144,8 +1557,7 @@ class BLEDOMInstance:
             self._read_uuid = None
             if client and client.is_connected:
                 try:
-                    device_name_lower = self._device.name.lower() if self._device and self._device.name else ""
-                    if not device_name_lower.startswith("melk") and not device_name_lower.startswith("ledble"):
+                    if self._notify_enabled:
                         await client.stop_notify(read_char)
                     await client.disconnect()
                 except Exception as e:
@@ -16,7 +16,6 @@ from homeassistant.components.light import (
 )
 from homeassistant.const import CONF_MAC
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers import device_registry
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -35,8 +34,8 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend({
 
 async def async_setup_entry(hass, config_entry, async_add_devices):
     data = hass.data[DOMAIN][config_entry.entry_id]
-    instance = data["instance"]
-    coordinator = data["coordinator"]
+    instance = data.instance
+    coordinator = data.coordinator
     async_add_devices([BLEDOMLight(coordinator, instance, config_entry.data["name"], config_entry.entry_id)])
 
 class BLEDOMLight(CoordinatorEntity[BLEDOMCoordinator], RestoreEntity, LightEntity):
@@ -44,6 +43,7 @@ class BLEDOMLight(CoordinatorEntity[BLEDOMCoordinator], RestoreEntity, LightEnti
         super().__init__(coordinator)
         self._instance = bledomInstance
         self._entry_id = entry_id
+        self._attr_device_info = DeviceInfo(**bledomInstance.device_info, name=name)
         # Note: ColorMode.WHITE cannot be combined with ColorMode.COLOR_TEMP per HA docs
         # We use COLOR_TEMP for adjustable white temperature (emulated via RGB)
         self._attr_supported_color_modes = {ColorMode.RGB, ColorMode.COLOR_TEMP}
@@ -100,19 +100,6 @@ class BLEDOMLight(CoordinatorEntity[BLEDOMCoordinator], RestoreEntity, LightEnti
             return match_max_scale((255,), self._instance.rgb_color)
         return None
 
-    @property
-    def device_info(self):
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={
-                (DOMAIN, self._instance.address)
-            },
-            name=self.name,
-            manufacturer="ELK",
-            model=self._instance._model or "BLEDOM",
-            connections={(device_registry.CONNECTION_BLUETOOTH, self._instance.address)},
-        )
-
     @property
     def should_poll(self):
         """No polling needed, coordinator handles updates."""
@@ -124,7 +111,7 @@ class BLEDOMLight(CoordinatorEntity[BLEDOMCoordinator], RestoreEntity, LightEnti
 
         # Restore the last known state
         if (last_state := await self.async_get_last_state()) is not None:
-            LOGGER.debug(f"Restoring previous state for {self.name}: {last_state.state}")
+            LOGGER.debug("Restoring previous state for %s: %s", self.name, last_state.state)
 
             # Restore on/off state
             if last_state.state == "on":
@@ -142,25 +129,25 @@ class BLEDOMLight(CoordinatorEntity[BLEDOMCoordinator], RestoreEntity, LightEnti
             # Restore brightness
             if ATTR_BRIGHTNESS in last_state.attributes:
                 self._instance._brightness = last_state.attributes[ATTR_BRIGHTNESS]
-                LOGGER.debug(f"Restored brightness: {self._instance._brightness}")
+                LOGGER.debug("Restored brightness: %s", self._instance._brightness)
 
             # Restore RGB color
             if ATTR_RGB_COLOR in last_state.attributes and last_state.attributes[ATTR_RGB_COLOR] is not None:
                 try:
                     self._instance._rgb_color = tuple(last_state.attributes[ATTR_RGB_COLOR])
                     self._attr_color_mode = ColorMode.RGB
-                    LOGGER.debug(f"Restored RGB color: {self._instance._rgb_color}")
+                    LOGGER.debug("Restored RGB color: %s", self._instance._rgb_color)
                 except (TypeError, ValueError) as e:
-                    LOGGER.warning(f"Invalid RGB color data, skipping: {e}")
+                    LOGGER.warning("Invalid RGB color data, skipping: %s", e)
 
             # Restore color temperature
             elif ATTR_COLOR_TEMP_KELVIN in last_state.attributes and last_state.attributes[ATTR_COLOR_TEMP_KELVIN] is not None:
                 try:
                     self._instance._color_temp_kelvin = last_state.attributes[ATTR_COLOR_TEMP_KELVIN]
                     self._attr_color_mode = ColorMode.COLOR_TEMP
-                    LOGGER.debug(f"Restored color temp: {self._instance._color_temp_kelvin}K")
+                    LOGGER.debug("Restored color temp: %sK", self._instance._color_temp_kelvin)
                 except (TypeError, ValueError) as e:
-                    LOGGER.warning(f"Invalid color temperature data, skipping: {e}")
+                    LOGGER.warning("Invalid color temperature data, skipping: %s", e)
 
             # Default to COLOR_TEMP if no color mode was restored
             else:
@@ -172,20 +159,20 @@ class BLEDOMLight(CoordinatorEntity[BLEDOMCoordinator], RestoreEntity, LightEnti
                 self._attr_effect = last_state.attributes[ATTR_EFFECT]
                 # Convert emoji label to effect name if needed
                 effect_name = EFFECT_LABEL_TO_NAME.get(self._attr_effect, self._attr_effect)
-                if effect_name in EFFECTS:
-                    self._instance._effect = EFFECTS[effect_name].value
-                LOGGER.debug(f"Restored effect: {self._attr_effect}")
+                if effect_name in EFFECTS.__members__:
+                    self._instance._effect = EFFECTS[effect_name]
+                LOGGER.debug("Restored effect: %s", self._attr_effect)
 
             # Restore effect speed from extra attributes
             if "effect_speed" in last_state.attributes:
                 try:
                     self._instance._effect_speed = int(last_state.attributes["effect_speed"])
-                    LOGGER.debug(f"Restored effect speed: {self._instance._effect_speed}")
+                    LOGGER.debug("Restored effect speed: %s", self._instance._effect_speed)
                 except (TypeError, ValueError) as e:
-                    LOGGER.warning(f"Invalid effect speed data, using default: {e}")
+                    LOGGER.warning("Invalid effect speed data, using default: %s", e)
         else:
             # No previous state found, set default values
-            LOGGER.debug(f"No previous state found for {self.name}, setting defaults")
+            LOGGER.debug("No previous state found for %s, setting defaults", self.name)
             self._instance._is_on = False
             self._instance._brightness = 255
             self._attr_color_mode = ColorMode.WHITE
@@ -196,7 +183,7 @@ class BLEDOMLight(CoordinatorEntity[BLEDOMCoordinator], RestoreEntity, LightEnti
         return res
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        LOGGER.debug(f"Params turn on: {kwargs} color mode: {self._attr_color_mode}")
+        LOGGER.debug("Params turn on: %s color mode: %s", kwargs, self._attr_color_mode)
         if not self.is_on:
             await self._instance.turn_on()
             if self._instance.reset:
@@ -226,16 +213,14 @@ class BLEDOMLight(CoordinatorEntity[BLEDOMCoordinator], RestoreEntity, LightEnti
             self._attr_effect = kwargs[ATTR_EFFECT]
             # Convert emoji label back to effect name if needed
             effect_name = EFFECT_LABEL_TO_NAME.get(kwargs[ATTR_EFFECT], kwargs[ATTR_EFFECT])
-            effect_value = EFFECTS[effect_name].value
-            await self._instance.set_effect(effect_value)
+            effect_value = EFFECTS[effect_name]
             # Also send effect speed to ensure it's applied
-            if self._instance.effect_speed is not None:
-                await self._instance.set_effect_speed(self._instance.effect_speed)
+            await self._instance.set_effect(effect_value, self._instance.effect_speed)
 
         self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        LOGGER.debug(f"Params turn off: {kwargs} color mode: {self._attr_color_mode}")
+        LOGGER.debug("Params turn off: %s color mode: %s", kwargs, self._attr_color_mode)
         await self._instance.turn_off()
         self.async_write_ha_state()
 
@@ -8,8 +8,8 @@ from homeassistant.components.number import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers import device_registry
-from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -20,14 +20,17 @@ from .elkbledom import BLEDOMInstance
 
 LOG = logging.getLogger(__name__)
 
+# Slider drags fire a value per step; only the last one in this window is sent
+SLIDER_DEBOUNCE_COOLDOWN = 0.15
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     data = hass.data[DOMAIN][config_entry.entry_id]
-    instance = data["instance"]
-    coordinator = data["coordinator"]
+    instance = data.instance
+    coordinator = data.coordinator
     async_add_entities([
         BLEDOMEffectSpeed(coordinator, instance, config_entry.entry_id),
         BLEDOMMicSensitivity(coordinator, instance, config_entry.entry_id)
@@ -47,8 +50,11 @@ class BLEDOMEffectSpeed(CoordinatorEntity[BLEDOMCoordinator], RestoreEntity, Num
     def __init__(self, coordinator: BLEDOMCoordinator, bledomInstance: BLEDOMInstance, entry_id: str) -> None:
         super().__init__(coordinator)
         self._instance = bledomInstance
+        self._attr_device_info = bledomInstance.device_info
         self._attr_unique_id = f"{self._instance.address}_effect_speed"
         self._effect_speed = 128  # Default to middle
+        self._pending_speed: int | None = None  # Set until the debounced send runs
+        self._debouncer: Debouncer | None = None
 
     @property
     def available(self) -> bool:
@@ -56,41 +62,58 @@ class BLEDOMEffectSpeed(CoordinatorEntity[BLEDOMCoordinator], RestoreEntity, Num
 
     @property
     def native_value(self) -> int | None:
+        if self._pending_speed is not None:
+            return self._pending_speed
         # Sync with instance value
         if self._instance.effect_speed is not None:
             return self._instance.effect_speed
         return self._effect_speed
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={
-                (DOMAIN, self._instance.address)
-            },
-            manufacturer="ELK",
-            model=self._instance._model or "BLEDOM",
-            connections={(device_registry.CONNECTION_BLUETOOTH,
-                          self._instance.address)},
-        )
-
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
-        await self._instance.set_effect_speed(int(value))
-        self._effect_speed = int(value)
+        self._effect_speed = self._pending_speed = int(value)
+        self.async_write_ha_state()
+        if self._debouncer is None:
+            await self._async_send_value()
+        else:
+            await self._debouncer.async_call()
+
+    async def _async_send_value(self) -> None:
+        """Send the latest effect speed to the device."""
+        speed = self._effect_speed
+        try:
+            await self._instance.set_effect_speed(speed)
+        finally:
+            # A newer slider value stays pending for the next send
+            if self._pending_speed == speed:
+                self._pending_speed = None
         self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
         """Restore previous state when entity is added to hass."""
         await super().async_added_to_hass()
+        self._debouncer = Debouncer(
+            self.hass,
+            LOG,
+            cooldown=SLIDER_DEBOUNCE_COOLDOWN,
+            immediate=False,
+            function=self._async_send_value,
+        )
 
         # Restore the last known effect speed
         if (last_state := await self.async_get_last_state()) is not None:
             try:
                 self._effect_speed = int(float(last_state.state))
-                LOG.debug(f"Restored effect speed for {self.name}: {self._effect_speed}")
+                LOG.debug("Restored effect speed for %s: %s", self.name, self._effect_speed)
             except (ValueError, TypeError):
-                LOG.debug(f"Could not restore effect speed for {self.name}, using default")
+                LOG.debug("Could not restore effect speed for %s, using default", self.name)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop any pending slider value."""
+        if self._debouncer is not None:
+            self._debouncer.async_shutdown()
+            self._debouncer = None
+        await super().async_will_remove_from_hass()
 
 class BLEDOMMicSensitivity(CoordinatorEntity[BLEDOMCoordinator], RestoreEntity, NumberEntity):
     """Microphone Sensitivity entity."""
@@ -106,8 +129,10 @@ class BLEDOMMicSensitivity(CoordinatorEntity[BLEDOMCoordinator], RestoreEntity,
     def __init__(self, coordinator: BLEDOMCoordinator, bledomInstance: BLEDOMInstance, entry_id: str) -> None:
         super().__init__(coordinator)
         self._instance = bledomInstance
+        self._attr_device_info = bledomInstance.device_info
         self._attr_unique_id = f"{self._instance.address}_mic_sensitivity"
         self._mic_sensitivity = 50
+        self._debouncer: Debouncer | None = None
 
     @property
     def available(self) -> bool:
@@ -117,34 +142,43 @@ class BLEDOMMicSensitivity(CoordinatorEntity[BLEDOMCoordinator], RestoreEntity,
     def native_value(self) -> int | None:
         return self._mic_sensitivity
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={
-                (DOMAIN, self._instance.address)
-            },
-            manufacturer="ELK",
-            model=self._instance._model or "BLEDOM",
-            connections={(device_registry.CONNECTION_BLUETOOTH,
-                          self._instance.address)},
-        )
-
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
-        await self._instance.set_mic_sensitivity(int(value))
         self._mic_sensitivity = int(value)
+        self.async_write_ha_state()
+        if self._debouncer is None:
+            await self._async_send_value()
+        else:
+            await self._debouncer.async_call()
+
+    async def _async_send_value(self) -> None:
+        """Send the latest mic sensitivity to the device."""
+        await self._instance.set_mic_sensitivity(self._mic_sensitivity)
 
     async def async_added_to_hass(self) -> None:
         """Restore previous state when entity is added to hass."""
         await super().async_added_to_hass()
+        self._debouncer = Debouncer(
+            self.hass,
+            LOG,
+            cooldown=SLIDER_DEBOUNCE_COOLDOWN,
+            immediate=False,
+            function=self._async_send_value,
+        )
 
         # Restore the last known mic sensitivity
         if (last_state := await self.async_get_last_state()) is not None:
             try:
                 self._mic_sensitivity = int(float(last_state.state))
-                LOG.debug(f"Restored mic sensitivity for {self.name}: {self._mic_sensitivity}")
+                LOG.debug("Restored mic sensitivity for %s: %s", self.name, self._mic_sensitivity)
             except (ValueError, TypeError):
-                LOG.debug(f"Could not restore mic sensitivity for {self.name}, using default (50)")
+                LOG.debug("Could not restore mic sensitivity for %s, using default (50)", self.name)
         else:
-            LOG.debug(f"No previous state found for {self.name}")
+            LOG.debug("No previous state found for %s", self.name)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop any pending slider value."""
+        if self._debouncer is not None:
+            self._debouncer.async_shutdown()
+            self._debouncer = None
+        await super().async_will_remove_from_hass()
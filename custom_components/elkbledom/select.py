@@ -1,17 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers import device_registry
-from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MIC_EFFECTS, MIC_EFFECTS_list
+from .const import DOMAIN, MIC_EFFECT_VALUES, MIC_EFFECTS_list, MIC_EFFECTS_set
 from .coordinator import BLEDOMCoordinator
 from .elkbledom import BLEDOMInstance
 
@@ -23,8 +23,8 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     data = hass.data[DOMAIN][config_entry.entry_id]
-    instance = data["instance"]
-    coordinator = data["coordinator"]
+    instance = data.instance
+    coordinator = data.coordinator
     async_add_entities([
         BLEDOMMicEffect(coordinator, instance, config_entry.entry_id)
     ])
@@ -40,8 +40,12 @@ class BLEDOMMicEffect(CoordinatorEntity[BLEDOMCoordinator], RestoreEntity, Selec
     def __init__(self, coordinator: BLEDOMCoordinator, bledomInstance: BLEDOMInstance, entry_id: str) -> None:
         super().__init__(coordinator)
         self._instance = bledomInstance
+        self._attr_device_info = bledomInstance.device_info
         self._attr_unique_id = f"{self._instance.address}_mic_effect"
         self._current_option = MIC_EFFECTS_list[0]
+        self._send_task: asyncio.Task | None = None
+        self._rollback_option = self._current_option
+        self._last_written: tuple | None = None
 
     @property
     def available(self) -> bool:
@@ -51,26 +55,48 @@ class BLEDOMMicEffect(CoordinatorEntity[BLEDOMCoordinator], RestoreEntity, Selec
     def current_option(self) -> str | None:
         return self._current_option
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={
-                (DOMAIN, self._instance.address)
-            },
-            manufacturer="ELK",
-            model=self._instance._model or "BLEDOM",
-            connections={(device_registry.CONNECTION_BLUETOOTH,
-                          self._instance.address)},
-        )
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when what this entity shows has changed."""
+        written = (self.available, self._current_option)
+        if written == self._last_written:
+            return
+        self._last_written = written
+        super()._handle_coordinator_update()
 
     async def async_select_option(self, option: str) -> None:
-        """Change the selected option."""
-        if option in MIC_EFFECTS_list:
-            effect_value = MIC_EFFECTS[option].value
+        """Change the selected option.
+
+        The new option is shown right away. A newer selection supersedes the
+        command still in flight, so only the latest one can roll back.
+        """
+        if option not in MIC_EFFECTS_set:
+            return
+        if self._send_task is None or self._send_task.done():
+            self._rollback_option = self._current_option
+        else:
+            self._send_task.cancel()
+        self._current_option = option
+        self.async_write_ha_state()
+        task = self._send_task = self.hass.async_create_task(
+            self._async_send_or_revert(option, MIC_EFFECT_VALUES[option])
+        )
+        await asyncio.wait((task,))
+        if not task.cancelled():
+            # Raise command errors to the service call
+            task.result()
+
+    async def _async_send_or_revert(self, option: str, effect_value: int) -> None:
+        """Send the mic effect, restoring the previous option if it fails."""
+        try:
             await self._instance.set_mic_effect(effect_value)
-            self._current_option = option
-            LOG.debug(f"Mic effect set to {option} (0x{effect_value:02x})")
+        except Exception as err:
+            LOG.warning("Could not set mic effect for %s: %s", self.name, err)
+            if self._current_option == option:
+                self._current_option = self._rollback_option
+                self.async_write_ha_state()
+            raise
+        LOG.debug("Mic effect set to %s (0x%02x)", option, effect_value)
 
     async def async_added_to_hass(self) -> None:
         """Restore previous state when entity is added to hass."""
@@ -78,8 +104,8 @@ class BLEDOMMicEffect(CoordinatorEntity[BLEDOMCoordinator], RestoreEntity, Selec
 
         # Restore the last known mic effect
         if (last_state := await self.async_get_last_state()) is not None:
-            if last_state.state in MIC_EFFECTS_list:
+            if last_state.state in MIC_EFFECTS_set:
                 self._current_option = last_state.state
-                LOG.debug(f"Restored mic effect for {self.name}: {self._current_option}")
+                LOG.debug("Restored mic effect for %s: %s", self.name, self._current_option)
             else:
-                LOG.debug(f"Could not restore mic effect for {self.name}, using default")
+                LOG.debug("Could not restore mic effect for %s, using default", self.name)
@@ -9,14 +9,13 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import SIGNAL_STRENGTH_DECIBELS_MILLIWATT
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers import device_registry
-from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
-from .coordinator import BLEDOMCoordinator
+from .coordinator import BLEDOMRSSICoordinator
 from .elkbledom import BLEDOMInstance
 
 LOG = logging.getLogger(__name__)
@@ -27,14 +26,14 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     data = hass.data[DOMAIN][config_entry.entry_id]
-    instance = data["instance"]
-    coordinator = data["coordinator"]
+    instance = data.instance
+    coordinator = data.rssi_coordinator
     async_add_entities([
         BLEDOMRSSISensor(coordinator, instance, config_entry.entry_id)
     ])
 
 
-class BLEDOMRSSISensor(CoordinatorEntity[BLEDOMCoordinator], SensorEntity):
+class BLEDOMRSSISensor(CoordinatorEntity[BLEDOMRSSICoordinator], SensorEntity):
     """RSSI sensor entity."""
 
     _attr_has_entity_name = True
@@ -45,11 +44,13 @@ class BLEDOMRSSISensor(CoordinatorEntity[BLEDOMCoordinator], SensorEntity):
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_entity_registry_enabled_default = False
 
-    def __init__(self, coordinator: BLEDOMCoordinator, bledomInstance: BLEDOMInstance, entry_id: str) -> None:
+    def __init__(self, coordinator: BLEDOMRSSICoordinator, bledomInstance: BLEDOMInstance, entry_id: str) -> None:
         super().__init__(coordinator)
         self._instance = bledomInstance
+        self._attr_device_info = bledomInstance.device_info
         self._attr_unique_id = f"{self._instance.address}_rssi"
         self._entry_id = entry_id
+        self._last_written: tuple | None = None
 
     @property
     def available(self) -> bool:
@@ -57,15 +58,13 @@ class BLEDOMRSSISensor(CoordinatorEntity[BLEDOMCoordinator], SensorEntity):
 
     @property
     def native_value(self) -> int | None:
-        return self._instance.rssi
+        return self._instance.rssi_smoothed
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
-            identifiers={
-                (DOMAIN, self._instance.address)
-            },
-            manufacturer="ELK",
-            model=self._instance._model or "BLEDOM",
-            connections={(device_registry.CONNECTION_BLUETOOTH, self._instance.address)},
-        )
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when what this entity shows has changed."""
+        written = (self.available, self.native_value)
+        if written == self._last_written:
+            return
+        self._last_written = written
+        super()._handle_coordinator_update()
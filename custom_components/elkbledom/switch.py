@@ -1,13 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers import device_registry
-from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -24,8 +25,8 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     data = hass.data[DOMAIN][config_entry.entry_id]
-    instance = data["instance"]
-    coordinator = data["coordinator"]
+    instance = data.instance
+    coordinator = data.coordinator
     async_add_entities([
         BLEDOMMicSwitch(coordinator, instance, config_entry.entry_id)
     ])
@@ -40,8 +41,12 @@ class BLEDOMMicSwitch(CoordinatorEntity[BLEDOMCoordinator], RestoreEntity, Switc
     def __init__(self, coordinator: BLEDOMCoordinator, bledomInstance: BLEDOMInstance, entry_id: str) -> None:
         super().__init__(coordinator)
         self._instance = bledomInstance
+        self._attr_device_info = bledomInstance.device_info
         self._attr_unique_id = f"{self._instance.address}_mic_enable"
         self._is_on = False
+        self._last_written: tuple | None = None
+        self._send_task: asyncio.Task | None = None
+        self._rollback_is_on = False
 
     @property
     def available(self) -> bool:
@@ -51,30 +56,52 @@ class BLEDOMMicSwitch(CoordinatorEntity[BLEDOMCoordinator], RestoreEntity, Switc
     def is_on(self) -> bool:
         return self._is_on
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={
-                (DOMAIN, self._instance.address)
-            },
-            manufacturer="ELK",
-            model=self._instance._model or "BLEDOM",
-            connections={(device_registry.CONNECTION_BLUETOOTH,
-                          self._instance.address)},
-        )
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when what this entity shows has changed."""
+        written = (self.available, self._is_on)
+        if written == self._last_written:
+            return
+        self._last_written = written
+        super()._handle_coordinator_update()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the microphone on."""
-        await self._instance.enable_mic()
-        self._is_on = True
-        LOG.debug(f"Microphone enabled for {self.name}")
+        await self._async_set_optimistic(True, self._instance.enable_mic)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the microphone off."""
-        await self._instance.disable_mic()
-        self._is_on = False
-        LOG.debug(f"Microphone disabled for {self.name}")
+        await self._async_set_optimistic(False, self._instance.disable_mic)
+
+    async def _async_set_optimistic(self, is_on: bool, command: Callable[[], Awaitable[None]]) -> None:
+        """Show the new state right away, then send the command.
+
+        A newer call supersedes the command still in flight, so only the
+        latest one can roll the state back.
+        """
+        if self._send_task is None or self._send_task.done():
+            self._rollback_is_on = self._is_on
+        else:
+            self._send_task.cancel()
+        self._is_on = is_on
+        self.async_write_ha_state()
+        task = self._send_task = self.hass.async_create_task(self._async_send_or_revert(command, is_on))
+        await asyncio.wait((task,))
+        if not task.cancelled():
+            # Raise command errors to the service call
+            task.result()
+
+    async def _async_send_or_revert(self, command: Callable[[], Awaitable[None]], is_on: bool) -> None:
+        """Send the command, restoring the previous state if it fails."""
+        try:
+            await command()
+        except Exception as err:
+            LOG.warning("Could not switch microphone for %s: %s", self.name, err)
+            if self._is_on == is_on:
+                self._is_on = self._rollback_is_on
+                self.async_write_ha_state()
+            raise
+        LOG.debug("Microphone %s for %s", "enabled" if is_on else "disabled", self.name)
 
     async def async_added_to_hass(self) -> None:
         """Restore previous state when entity is added to hass."""
@@ -84,9 +111,9 @@ class BLEDOMMicSwitch(CoordinatorEntity[BLEDOMCoordinator], RestoreEntity, Switc
         if (last_state := await self.async_get_last_state()) is not None:
             if last_state.state == "on":
                 self._is_on = True
-                LOG.debug(f"Restored mic state for {self.name}: ON")
+                LOG.debug("Restored mic state for %s: ON", self.name)
             elif last_state.state == "off":
                 self._is_on = False
-                LOG.debug(f"Restored mic state for {self.name}: OFF")
+                LOG.debug("Restored mic state for %s: OFF", self.name)
         else:
-            LOG.debug(f"No previous mic state found for {self.name}, defaulting to OFF")
+            LOG.debug("No previous mic state found for %s, defaulting to OFF", self.name)
@@ -2,9 +2,10 @@
 """Interactive tool to test ELK-BLEDDM commands and calibrate colors."""
 
 import asyncio
-import colorsys
+import threading
 
 from bleak import BleakClient
+from bleak.backends.characteristic import BleakGATTCharacteristic
 
 DEVICE_MAC = "BE:27:EB:01:83:20"
 WRITE_UUID = "0000fff3-0000-1000-8000-00805f9b34fb"
@@ -16,38 +17,130 @@ RGB_GAINS = {"r": 1.0, "g": 1.0, "b": 1.0}
 # Some devices expect non-RGB channel ordering (common: GRB).
 CHANNEL_ORDER = "rgb"  # one of: rgb, rbg, grb, gbr, brg, bgr
 
+# Source index of each output channel, per order
+_PERM_TABLE = {
+    "rgb": (0, 1, 2),
+    "rbg": (0, 2, 1),
+    "grb": (1, 0, 2),
+    "gbr": (1, 2, 0),
+    "brg": (2, 0, 1),
+    "bgr": (2, 1, 0),
+}
+_CHANNEL_PERM = _PERM_TABLE[CHANNEL_ORDER]
 
-def _clamp_byte(value: int) -> int:
-    return max(0, min(255, int(value)))
+
+def _set_order(value: str) -> None:
+    global CHANNEL_ORDER, _CHANNEL_PERM
+    CHANNEL_ORDER = value
+    _CHANNEL_PERM = _PERM_TABLE[value]
+
+
+# Color command with the fixed bytes filled in; only 4-6 change per write
+_RGB_FRAME = bytearray(b"\x7e\x00\x05\x03\x00\x00\x00\x00\xef")
+
+
+def rgb_frame(r: int, g: int, b: int) -> bytes:
+    _RGB_FRAME[4] = r
+    _RGB_FRAME[5] = g
+    _RGB_FRAME[6] = b
+    return bytes(_RGB_FRAME)
 
 
 def apply_rgb_gains(r: int, g: int, b: int) -> tuple[int, int, int]:
+    gr, gg, gb = RGB_GAINS["r"], RGB_GAINS["g"], RGB_GAINS["b"]
     return (
-        _clamp_byte(r * RGB_GAINS["r"]),
-        _clamp_byte(g * RGB_GAINS["g"]),
-        _clamp_byte(b * RGB_GAINS["b"]),
+        max(0, min(255, int(r * gr))),
+        max(0, min(255, int(g * gg))),
+        max(0, min(255, int(b * gb))),
     )
 
 
+def format_gains() -> str:
+    gr, gg, gb = RGB_GAINS["r"], RGB_GAINS["g"], RGB_GAINS["b"]
+    return f"r={gr:.3f} g={gg:.3f} b={gb:.3f}"
+
+
 def apply_channel_order(r: int, g: int, b: int) -> tuple[int, int, int]:
-    mapping = {
-        "rgb": (r, g, b),
-        "rbg": (r, b, g),
-        "grb": (g, r, b),
-        "gbr": (g, b, r),
-        "brg": (b, r, g),
-        "bgr": (b, g, r),
-    }
-    return mapping.get(CHANNEL_ORDER, (r, g, b))
+    t = (r, g, b)
+    p = _CHANNEL_PERM
+    return (t[p[0]], t[p[1]], t[p[2]])
 
 
 def hsv_to_rgb_bytes(h: float, s: float, v: float) -> tuple[int, int, int]:
     """Convert HSV (h in [0,360), s/v in [0,1]) -> RGB bytes."""
-    h = (h % 360.0) / 360.0
+    # colorsys.hsv_to_rgb's sector math; scaling via /360*6 (not /60) keeps
+    # the float rounding, and so the output bytes, identical to it
+    h6 = (h % 360.0) / 360.0 * 6.0
     s = max(0.0, min(1.0, s))
     v = max(0.0, min(1.0, v))
-    r_f, g_f, b_f = colorsys.hsv_to_rgb(h, s, v)
-    return (int(round(r_f * 255)), int(round(g_f * 255)), int(round(b_f * 255)))
+    i = int(h6)
+    f = h6 - i
+    vv = int(round(v * 255))
+    p = int(round(v * (1.0 - s) * 255))
+    q = int(round(v * (1.0 - s * f) * 255))
+    t = int(round(v * (1.0 - s * (1.0 - f)) * 255))
+    # One (R, G, B) arrangement per 60-degree hue sector
+    return ((vv, t, p), (q, vv, p), (p, vv, t), (p, q, vv), (t, p, vv), (vv, p, q))[i % 6]
+
+
+# The outstanding stdin read, if any. A blocked input() can't be
+# interrupted, so a read left over from an aborted prompt is reused by the
+# next one instead of starting a second reader on the same stdin.
+_pending_read: asyncio.Future[str] | None = None
+
+
+async def ainput(prompt: str = "") -> str:
+    """input() that keeps the event loop (and notifications) running."""
+    global _pending_read
+    if _pending_read is not None and not _pending_read.done():
+        print(prompt, end="", flush=True)
+        return await asyncio.shield(_pending_read)
+
+    loop = asyncio.get_running_loop()
+    future = _pending_read = loop.create_future()
+
+    def _resolve(line: str | None, err: BaseException | None) -> None:
+        if future.done():
+            return
+        if err is not None:
+            future.set_exception(err)
+        else:
+            future.set_result(line)
+
+    def _read() -> None:
+        try:
+            line = input(prompt)
+        except BaseException as err:  # EOFError, KeyboardInterrupt
+            loop.call_soon_threadsafe(_resolve, None, err)
+        else:
+            loop.call_soon_threadsafe(_resolve, line, None)
+
+    # A daemon thread rather than the default executor, so Ctrl+C can exit
+    # without waiting for a pending read to return
+    threading.Thread(target=_read, daemon=True).start()
+    # Shielded so Ctrl+C only cancels this wait, not the read itself
+    return await asyncio.shield(future)
+
+
+def _clear_interrupt() -> None:
+    """Undo the task cancellation asyncio.run() uses to deliver Ctrl+C."""
+    task = asyncio.current_task()
+    if task is not None and task.cancelling():
+        task.uncancel()
+
+
+# Preview colors, computed once. Gains and channel order are applied per
+# write in send_rgb since they can change between previews.
+HUE_WHEEL = tuple((h, hsv_to_rgb_bytes(h, 1.0, 1.0)) for h in range(0, 360, 30))
+SWEEP_LEVELS = (64, 96, 128, 160, 192, 224, 255)
+# Channel pairs for the cyan/magenta sweeps: first channel full while the
+# second rises, then the other way round
+SWEEP_RATIOS = tuple((255, x) for x in SWEEP_LEVELS) + tuple((x, 255) for x in reversed(SWEEP_LEVELS[:-1]))
+
+
+def _precompute_frames(colors: list[tuple[int, int, int]]) -> list[bytes]:
+    """Device frames for colors under the current gains and channel order."""
+    return [rgb_frame(*apply_channel_order(*apply_rgb_gains(r, g, b))) for r, g, b in colors]
 
 
 async def send_rgb(client: BleakClient, r: int, g: int, b: int, desc: str = "") -> None:
@@ -55,14 +148,13 @@ async def send_rgb(client: BleakClient, r: int, g: int, b: int, desc: str = "")
     rr, gg, bb = apply_channel_order(rr, gg, bb)
     await send_cmd(
         client,
-        [0x7e, 0x00, 0x05, 0x03, rr, gg, bb, 0x00, 0xef],
-        desc or f"RGB({r},{g},{b}) -> ({rr},{gg},{bb}) order={CHANNEL_ORDER} gains r={RGB_GAINS['r']:.3f} g={RGB_GAINS['g']:.3f} b={RGB_GAINS['b']:.3f}",
+        rgb_frame(rr, gg, bb),
+        desc or f"RGB({r},{g},{b}) -> ({rr},{gg},{bb}) order={CHANNEL_ORDER} gains {format_gains()}",
     )
 
 
 async def color_mixing_menu(client: BleakClient) -> None:
     """Interactive color mixing (HSV) + channel-order verification."""
-    global CHANNEL_ORDER
     print("\n=== Color Mixing (HSV) ===")
     print(
         "Commands: hsv <h> <s> <v>, hue, order <rgb|rbg|grb|gbr|brg|bgr>, "
@@ -75,14 +167,14 @@ async def color_mixing_menu(client: BleakClient) -> None:
     last_rgb: tuple[int, int, int] = (255, 255, 255)
 
     while True:
-        cmd = input("mix> ").strip().lower()
+        cmd = (await ainput("mix> ")).strip().lower()
         if cmd in {"done", "exit", "quit"}:
             print(f"Using CHANNEL_ORDER={CHANNEL_ORDER}")
             return
 
         if cmd == "show":
             print(
-                f"order={CHANNEL_ORDER} gains: r={RGB_GAINS['r']:.3f} g={RGB_GAINS['g']:.3f} b={RGB_GAINS['b']:.3f} (step={step:.3f})"
+                f"order={CHANNEL_ORDER} gains: {format_gains()} (step={step:.3f})"
             )
             continue
 
@@ -97,10 +189,10 @@ async def color_mixing_menu(client: BleakClient) -> None:
 
         if cmd.startswith("order "):
             value = cmd.split(maxsplit=1)[1]
-            if value not in {"rgb", "rbg", "grb", "gbr", "brg", "bgr"}:
+            if value not in _PERM_TABLE:
                 print("Invalid order. Use one of: rgb rbg grb gbr brg bgr")
                 continue
-            CHANNEL_ORDER = value
+            _set_order(value)
             print(f"CHANNEL_ORDER set to {CHANNEL_ORDER}")
             continue
 
@@ -108,10 +200,10 @@ async def color_mixing_menu(client: BleakClient) -> None:
             print("Showing primaries. Press Enter to advance.")
             last_rgb = (255, 0, 0)
             await send_rgb(client, *last_rgb, "Primary: RED")
-            input("Enter for GREEN...")
+            await ainput("Enter for GREEN...")
             last_rgb = (0, 255, 0)
             await send_rgb(client, *last_rgb, "Primary: GREEN")
-            input("Enter for BLUE...")
+            await ainput("Enter for BLUE...")
             last_rgb = (0, 0, 255)
             await send_rgb(client, *last_rgb, "Primary: BLUE")
             continue
@@ -120,13 +212,13 @@ async def color_mixing_menu(client: BleakClient) -> None:
             print("Showing secondaries. Press Enter to advance.")
             last_rgb = (255, 255, 0)
             await send_rgb(client, *last_rgb, "Secondary: YELLOW (R+G)")
-            input("Enter for CYAN...")
+            await ainput("Enter for CYAN...")
             last_rgb = (0, 255, 255)
             await send_rgb(client, *last_rgb, "Secondary: CYAN (G+B)")
-            input("Enter for MAGENTA...")
+            await ainput("Enter for MAGENTA...")
             last_rgb = (255, 0, 255)
             await send_rgb(client, *last_rgb, "Secondary: MAGENTA (R+B)")
-            input("Enter for WHITE...")
+            await ainput("Enter for WHITE...")
             last_rgb = (255, 255, 255)
             await send_rgb(client, *last_rgb, "White (R+G+B)")
             continue
@@ -148,63 +240,31 @@ async def color_mixing_menu(client: BleakClient) -> None:
             if mode not in {"yellow", "cyan", "magenta"}:
                 print("Expected: sweep <yellow|cyan|magenta>")
                 continue
+            if mode == "yellow":
+                # Keep B=0; vary G up from warm/orange toward yellow.
+                colors = [(255, g, 0) for g in SWEEP_LEVELS]
+            elif mode == "cyan":
+                # Keep R=0; vary G/B ratio to find the deepest cyan (least white).
+                colors = [(0, g, b) for g, b in SWEEP_RATIOS]
+            else:
+                # Keep G=0; vary R/B ratio.
+                colors = [(r, 0, b) for r, b in SWEEP_RATIOS]
             print("Press Enter to step; type Ctrl+C to abort sweep.")
             try:
-                if mode == "yellow":
-                    # Keep B=0; vary G up from warm/orange toward yellow.
-                    for g in [64, 96, 128, 160, 192, 224, 255]:
-                        last_rgb = (255, g, 0)
-                        await send_rgb(client, *last_rgb, f"Sweep yellow: R=255 G={g} B=0")
-                        input("Enter...")
-                elif mode == "cyan":
-                    # Keep R=0; vary G/B ratio to find the deepest cyan (least white).
-                    for g, b in [
-                        (255, 64),
-                        (255, 96),
-                        (255, 128),
-                        (255, 160),
-                        (255, 192),
-                        (255, 224),
-                        (255, 255),
-                        (224, 255),
-                        (192, 255),
-                        (160, 255),
-                        (128, 255),
-                        (96, 255),
-                        (64, 255),
-                    ]:
-                        last_rgb = (0, g, b)
-                        await send_rgb(client, *last_rgb, f"Sweep cyan: R=0 G={g} B={b}")
-                        input("Enter...")
-                else:
-                    # Keep G=0; vary R/B ratio.
-                    for r, b in [
-                        (255, 64),
-                        (255, 96),
-                        (255, 128),
-                        (255, 160),
-                        (255, 192),
-                        (255, 224),
-                        (255, 255),
-                        (224, 255),
-                        (192, 255),
-                        (160, 255),
-                        (128, 255),
-                        (96, 255),
-                        (64, 255),
-                    ]:
-                        last_rgb = (r, 0, b)
-                        await send_rgb(client, *last_rgb, f"Sweep magenta: R={r} G=0 B={b}")
-                        input("Enter...")
-            except KeyboardInterrupt:
-                print("Sweep aborted")
+                for last_rgb, frame in zip(colors, _precompute_frames(colors), strict=True):
+                    r, g, b = last_rgb
+                    await send_cmd(client, frame, f"Sweep {mode}: R={r} G={g} B={b}")
+                    await ainput("Enter...")
+            except (KeyboardInterrupt, asyncio.CancelledError):
+                _clear_interrupt()
+                print("\nSweep aborted")
             continue
 
         if cmd in {"r+", "r-", "g+", "g-", "b+", "b-"}:
             channel = cmd[0]
             direction = 1 if cmd[1] == "+" else -1
             RGB_GAINS[channel] = max(0.0, RGB_GAINS[channel] + direction * step)
-            print(f"gains now: r={RGB_GAINS['r']:.3f} g={RGB_GAINS['g']:.3f} b={RGB_GAINS['b']:.3f}")
+            print(f"gains now: {format_gains()}")
             # Auto-preview the last color to make gain tuning fast.
             await send_rgb(client, *last_rgb, f"Preview after gain tweak (last={last_rgb})")
             continue
@@ -228,26 +288,57 @@ async def color_mixing_menu(client: BleakClient) -> None:
 
         if cmd == "hue":
             print("Hue wheel preview (S=1, V=1). Press Enter to step.")
-            for h in range(0, 360, 30):
-                r, g, b = hsv_to_rgb_bytes(h, 1.0, 1.0)
-                last_rgb = (r, g, b)
-                await send_rgb(client, r, g, b, f"Hue {h}")
-                input("Enter for next hue...")
+            colors = [rgb for _, rgb in HUE_WHEEL]
+            for (h, rgb), frame in zip(HUE_WHEEL, _precompute_frames(colors), strict=True):
+                last_rgb = rgb
+                await send_cmd(client, frame, f"Hue {h}")
+                await ainput("Enter for next hue...")
             continue
 
         print(
             "Unknown command. Try: primaries, secondaries, gray 180, order grb, hsv 210 0.7 0.8, hue, show, done"
         )
 
+# Set by notification_handler so send_cmd can stop waiting as soon as the
+# device answers
+NOTIFIED = asyncio.Event()
+RESPONSE_TIMEOUT = 0.3
+
+# Resolved once after connecting so writes skip the UUID lookup
+_write_char: BleakGATTCharacteristic | str = WRITE_UUID
+
+
 def notification_handler(sender, data):
     """Handle notifications from the device."""
     print(f"  <- Notification: {data.hex(' ')}")
+    NOTIFIED.set()
 
-async def send_cmd(client, cmd_bytes, desc=""):
+async def send_cmd(client, cmd: bytes, desc=""):
     """Send a command and wait for response."""
-    print(f"  -> Sending: {bytes(cmd_bytes).hex(' ')}  {desc}")
-    await client.write_gatt_char(WRITE_UUID, bytes(cmd_bytes), response=False)
-    await asyncio.sleep(0.3)
+    print(f"  -> Sending: {cmd.hex(' ')}  {desc}")
+    NOTIFIED.clear()
+    await client.write_gatt_char(_write_char, cmd, response=False)
+    # Not every command is answered; don't wait longer than the old fixed delay
+    try:
+        await asyncio.wait_for(NOTIFIED.wait(), RESPONSE_TIMEOUT)
+    except TimeoutError:
+        pass
+
+
+async def print_link_info(client: BleakClient) -> None:
+    """Print the ATT MTU and the largest write-without-response payload."""
+    # BlueZ only reports the negotiated MTU after acquiring it
+    acquire = getattr(getattr(client, "_backend", None), "_acquire_mtu", None)
+    if acquire is not None:
+        try:
+            await acquire()
+        except Exception as err:
+            print(f"Could not acquire MTU: {err}")
+    char = client.services.get_characteristic(WRITE_UUID)
+    max_write = char.max_write_without_response_size if char else None
+    print(f"MTU: {client.mtu_size}, max write without response: {max_write} bytes")
+    if max_write is not None and max_write < 9:
+        print("Warning: 9-byte commands won't fit in one write")
 
 
 async def rgb_calibration_menu(client: BleakClient) -> None:
@@ -265,14 +356,14 @@ async def rgb_calibration_menu(client: BleakClient) -> None:
     test_levels = [24, 48, 80, 120, 160, 200, 240]
 
     while True:
-        cmd = input("cal> ").strip().lower()
+        cmd = (await ainput("cal> ")).strip().lower()
         if cmd in {"done", "exit", "quit"}:
-            print(f"Saved gains: r={RGB_GAINS['r']:.3f} g={RGB_GAINS['g']:.3f} b={RGB_GAINS['b']:.3f}")
+            print(f"Saved gains: {format_gains()}")
             return
 
         if cmd == "show":
             print(
-                f"gains: r={RGB_GAINS['r']:.3f} g={RGB_GAINS['g']:.3f} b={RGB_GAINS['b']:.3f} "
+                f"gains: {format_gains()} "
                 f"(step={step:.3f}, base={base})"
             )
             continue
@@ -312,7 +403,7 @@ async def rgb_calibration_menu(client: BleakClient) -> None:
             r, g, b = apply_rgb_gains(base, base, base)
             await send_cmd(
                 client,
-                [0x7e, 0x00, 0x05, 0x03, r, g, b, 0x00, 0xef],
+                rgb_frame(r, g, b),
                 f"TEST grey({base}) -> ({r},{g},{b})",
             )
             continue
@@ -323,10 +414,10 @@ async def rgb_calibration_menu(client: BleakClient) -> None:
                 r, g, b = apply_rgb_gains(lvl, lvl, lvl)
                 await send_cmd(
                     client,
-                    [0x7e, 0x00, 0x05, 0x03, r, g, b, 0x00, 0xef],
+                    rgb_frame(r, g, b),
                     f"LEVEL grey({lvl}) -> ({r},{g},{b})",
                 )
-                input("Press Enter for next level...")
+                await ainput("Press Enter for next level...")
             continue
 
         if cmd in {"r+", "r-", "g+", "g-", "b+", "b-"}:
@@ -334,20 +425,23 @@ async def rgb_calibration_menu(client: BleakClient) -> None:
             direction = 1 if cmd[1] == "+" else -1
             RGB_GAINS[channel] = max(0.0, RGB_GAINS[channel] + direction * step)
             r, g, b = apply_rgb_gains(base, base, base)
-            await send_cmd(client, [0x7e, 0x00, 0x05, 0x03, r, g, b, 0x00, 0xef], f"TEST -> ({r},{g},{b})")
+            await send_cmd(client, rgb_frame(r, g, b), f"TEST -> ({r},{g},{b})")
             continue
 
         print("Unknown command. Try: show, test, r+/r-, g+/g-, b+/b-, step 0.05, set 1.0 1.0 1.0, done")
 
 async def main():
+    global _write_char
     print(f"Connecting to {DEVICE_MAC}...")
 
     async with BleakClient(DEVICE_MAC) as client:
         print(f"Connected: {client.is_connected}")
+        await print_link_info(client)
 
         # Enable notifications
         await client.start_notify(READ_UUID, notification_handler)
         print("Notifications enabled\n")
+        _write_char = client.services.get_characteristic(WRITE_UUID) or WRITE_UUID
 
         while True:
             print("\n=== ELK-BLEDDM Test Menu ===")
@@ -362,20 +456,21 @@ async def main():
             print("7. Set Effect Speed")
             print("8. Send custom hex command")
             print("9. Probe all effects (0x80-0x9F)")
+            print("9f. Cycle all effects on a timer")
             print("0. Exit")
 
-            choice = input("\nChoice: ").strip()
+            choice = (await ainput("\nChoice: ")).strip()
 
             if choice == "1":
-                await send_cmd(client, [0x7e, 0x00, 0x04, 0xf0, 0x00, 0x01, 0xff, 0x00, 0xef], "ON")
+                await send_cmd(client, bytes([0x7e, 0x00, 0x04, 0xf0, 0x00, 0x01, 0xff, 0x00, 0xef]), "ON")
 
             elif choice == "2":
-                await send_cmd(client, [0x7e, 0x00, 0x04, 0x00, 0x00, 0x00, 0xff, 0x00, 0xef], "OFF")
+                await send_cmd(client, bytes([0x7e, 0x00, 0x04, 0x00, 0x00, 0x00, 0xff, 0x00, 0xef]), "OFF")
 
             elif choice == "3":
-                r = int(input("Red (0-255): "))
-                g = int(input("Green (0-255): "))
-                b = int(input("Blue (0-255): "))
+                r = int(await ainput("Red (0-255): "))
+                g = int(await ainput("Green (0-255): "))
+                b = int(await ainput("Blue (0-255): "))
                 await send_rgb(client, r, g, b)
 
             elif choice.lower() == "3b":
@@ -385,34 +480,47 @@ async def main():
                 await color_mixing_menu(client)
 
             elif choice == "4":
-                val = int(input("Brightness (0-100): "))
-                await send_cmd(client, [0x7e, 0x04, 0x01, val, 0xff, 0x00, 0xff, 0x00, 0xef], f"Brightness {val}%")
+                val = int(await ainput("Brightness (0-100): "))
+                await send_cmd(client, bytes([0x7e, 0x04, 0x01, val, 0xff, 0x00, 0xff, 0x00, 0xef]), f"Brightness {val}%")
 
             elif choice == "5":
-                val = int(input("White intensity (0-100): "))
-                await send_cmd(client, [0x7e, 0x00, 0x01, val, 0x00, 0x00, 0x00, 0x00, 0xef], f"White {val}%")
+                val = int(await ainput("White intensity (0-100): "))
+                await send_cmd(client, bytes([0x7e, 0x00, 0x01, val, 0x00, 0x00, 0x00, 0x00, 0xef]), f"White {val}%")
 
             elif choice == "6":
                 print("Effects: 0x80=jump RGB, 0x81=jump RGBYCMW, 0x82=crossfade RGB...")
-                val = input("Effect hex (e.g. 80): ")
+                val = await ainput("Effect hex (e.g. 80): ")
                 effect = int(val, 16)
-                await send_cmd(client, [0x7e, 0x00, 0x03, effect, 0x03, 0x00, 0x00, 0x00, 0xef], f"Effect 0x{effect:02x}")
+                await send_cmd(client, bytes([0x7e, 0x00, 0x03, effect, 0x03, 0x00, 0x00, 0x00, 0xef]), f"Effect 0x{effect:02x}")
 
             elif choice == "7":
-                val = int(input("Speed (0-255, 0=fast, 255=slow): "))
-                await send_cmd(client, [0x7e, 0x00, 0x02, val, 0x00, 0x00, 0x00, 0x00, 0xef], f"Speed {val}")
+                val = int(await ainput("Speed (0-255, 0=fast, 255=slow): "))
+                await send_cmd(client, bytes([0x7e, 0x00, 0x02, val, 0x00, 0x00, 0x00, 0x00, 0xef]), f"Speed {val}")
 
             elif choice == "8":
-                hex_str = input("Hex command (e.g. 7e0004f00001ff00ef): ")
+                hex_str = await ainput("Hex command (e.g. 7e0004f00001ff00ef): ")
                 cmd = bytes.fromhex(hex_str.replace(" ", ""))
-                await send_cmd(client, list(cmd), "Custom")
+                await send_cmd(client, cmd, "Custom")
 
             elif choice == "9":
                 print("Probing effects 0x80-0x9F (press Ctrl+C to stop)...")
+                try:
+                    for effect in range(0x80, 0xA0):
+                        print(f"\nEffect 0x{effect:02x}:")
+                        await send_cmd(client, bytes([0x7e, 0x00, 0x03, effect, 0x03, 0x00, 0x00, 0x00, 0xef]))
+                        await ainput("Press Enter for next effect...")
+                except (KeyboardInterrupt, asyncio.CancelledError):
+                    _clear_interrupt()
+                    print("\nProbe stopped")
+
+            elif choice.lower() == "9f":
+                val = (await ainput("Seconds per effect (default 1): ")).strip()
+                delay = float(val) if val else 1.0
+                print(f"Cycling effects 0x80-0x9F every {delay}s...")
                 for effect in range(0x80, 0xA0):
-                    print(f"\nEffect 0x{effect:02x}:")
-                    await send_cmd(client, [0x7e, 0x00, 0x03, effect, 0x03, 0x00, 0x00, 0x00, 0xef])
-                    input("Press Enter for next effect...")
+                    print(f"Effect 0x{effect:02x}")
+                    await client.write_gatt_char(_write_char, bytes([0x7e, 0x00, 0x03, effect, 0x03, 0x00, 0x00, 0x00, 0xef]), response=False)
+                    await asyncio.sleep(delay)
 
             elif choice == "0":
                 print("Exiting...")
@@ -0,0 +1,33 @@
+"""Tests for the brightness percent conversion tables."""
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.elkbledom.elkbledom import _255_TO_PCT, _PCT_TO_255  # noqa: E402
+
+
+def test_pct_to_255_endpoints():
+    assert len(_PCT_TO_255) == 101
+    assert _PCT_TO_255[0] == 0
+    assert _PCT_TO_255[50] == 128
+    assert _PCT_TO_255[100] == 255
+
+
+def test_255_to_pct_endpoints():
+    assert len(_255_TO_PCT) == 256
+    assert _255_TO_PCT[0] == 0
+    assert _255_TO_PCT[1] == 0
+    assert _255_TO_PCT[2] == 1
+    assert _255_TO_PCT[128] == 50
+    assert _255_TO_PCT[255] == 100
+
+
+@pytest.mark.parametrize("pct", range(101))
+def test_pct_round_trip(pct):
+    assert _255_TO_PCT[_PCT_TO_255[pct]] == pct
+
+
+def test_tables_are_monotonic():
+    assert list(_PCT_TO_255) == sorted(_PCT_TO_255)
+    assert list(_255_TO_PCT) == sorted(_255_TO_PCT)